@@ -16,20 +16,166 @@ Slot System:
 - [threshold_slot]  → optional threshold attachment
 """
 
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
-import json
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from itertools import product
+from uuid import uuid4
+from weakref import WeakValueDictionary
+import numpy as np
 
 try:
     import bpy
-    import bmesh
 except ImportError:
     bpy = None
-    bmesh = None
 
-from ..engine.grid_pos import GridPos, meters_to_units
+from ..engine.grid_pos import GridPos, meters_to_grid, meters_to_units
 from ..engine.grid_object import GridObjectMixin
-from .. import config
+from .. import config, jsonio
+from .wall import CUBE_FACES, CUBE_VERTS
+
+
+@dataclass
+class PartArray:
+    """
+    Door parts stored column-wise; row i describes the part names[i].
+    
+    Indexing by part name returns the row as a read-only mapping, so
+    ``parts["door_leaf"]`` reads like the old dict-of-dicts. Rows are
+    snapshots: edit the columns of a ``copy()`` instead.
+    
+    Attributes:
+        names: Part names
+        types: Part types ("frame_vertical" | "frame_horizontal" | "leaf")
+        materials: Part material names
+        swings: Swing direction for the leaf, None for frame parts
+        positions: (N, 3) minimum corners in meters
+        sizes: (N, 3) extents in meters
+    """
+    names: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    materials: List[str] = field(default_factory=list)
+    swings: List[Optional[str]] = field(default_factory=list)
+    positions: np.ndarray = field(default_factory=lambda: np.empty((0, 3)))
+    sizes: np.ndarray = field(default_factory=lambda: np.empty((0, 3)))
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+    
+    def copy(self) -> "PartArray":
+        return PartArray(
+            list(self.names), list(self.types), list(self.materials), list(self.swings),
+            self.positions.copy(), self.sizes.copy()
+        )
+    
+    def __getitem__(self, name: str) -> Mapping:
+        i = self.names.index(name)
+        return MappingProxyType(self._row(i, self.positions[i].tolist(), self.sizes[i].tolist()))
+    
+    def _row(self, i: int, position: List[float], size: List[float]) -> Dict:
+        row = {
+            "type": self.types[i],
+            "position": position,
+            "size": size,
+            "material": self.materials[i]
+        }
+        if self.swings[i] is not None:
+            row["swing"] = self.swings[i]
+        return row
+    
+    def bounds(self) -> np.ndarray:
+        """(2, 3) array of the min and max corners over all parts; zeros when empty."""
+        if not len(self):
+            return np.zeros((2, 3))
+        return np.stack([self.positions.min(axis=0), (self.positions + self.sizes).max(axis=0)])
+    
+    def items(self) -> Iterator[Tuple[str, Mapping]]:
+        for name, row in self.to_dict().items():
+            yield name, MappingProxyType(row)
+    
+    def to_dict(self) -> Dict[str, Dict]:
+        """JSON-ready dict-of-dicts, converting each array column once."""
+        positions = self.positions.tolist()
+        sizes = self.sizes.tolist()
+        return {name: self._row(i, positions[i], sizes[i]) for i, name in enumerate(self.names)}
+
+
+@dataclass
+class SlotArray:
+    """
+    Door slots stored column-wise; row i describes the slot ids[i].
+    
+    Iterating yields one read-only mapping per slot in the old list-of-dicts
+    layout. Rows are snapshots: edit the columns of a ``copy()`` instead.
+    
+    Attributes:
+        ids: Slot identifiers
+        types: Slot types
+        grid_pos: (N, 3) int grid coordinates
+        positions: (N, 3) positions in meters
+        sizes: (N, 2) width/height in meters
+        required: (N,) bool
+        occupied: (N,) bool
+    """
+    ids: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    grid_pos: np.ndarray = field(default_factory=lambda: np.empty((0, 3), dtype=np.int64))
+    positions: np.ndarray = field(default_factory=lambda: np.empty((0, 3)))
+    sizes: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))
+    required: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    occupied: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def copy(self) -> "SlotArray":
+        return SlotArray(
+            list(self.ids), list(self.types), self.grid_pos.copy(), self.positions.copy(),
+            self.sizes.copy(), self.required.copy(), self.occupied.copy()
+        )
+    
+    def __iter__(self) -> Iterator[Mapping]:
+        for slot in self.to_list():
+            slot["grid_pos"] = GridPos(*slot["grid_pos"])
+            slot["pos_meters"] = tuple(slot["pos_meters"])
+            slot["size_meters"] = tuple(slot["size_meters"])
+            yield MappingProxyType(slot)
+    
+    def index_by_id(self) -> Mapping[str, Tuple[Mapping, ...]]:
+        """Read-only slot id -> slots index; the slot rows are read-only too."""
+        by_id: Dict[str, List[Mapping]] = {}
+        for slot in self:
+            by_id.setdefault(slot["id"], []).append(slot)
+        return MappingProxyType({slot_id: tuple(slots) for slot_id, slots in by_id.items()})
+    
+    def to_list(self) -> List[Dict]:
+        """JSON-ready list of slot dicts, converting each array column once."""
+        return [
+            {
+                "id": slot_id,
+                "type": slot_type,
+                "grid_pos": grid_pos,
+                "pos_meters": pos,
+                "size_meters": size,
+                "required": required,
+                "occupied": occupied
+            }
+            for slot_id, slot_type, grid_pos, pos, size, required, occupied in zip(
+                self.ids,
+                self.types,
+                self.grid_pos.tolist(),
+                self.positions.tolist(),
+                self.sizes.tolist(),
+                self.required.tolist(),
+                self.occupied.tolist()
+            )
+        ]
 
 
 @dataclass
@@ -45,9 +191,9 @@ class DoorData(GridObjectMixin):
         style: Door style ("single" | "double" | "garage")
         material: Leaf material ("wood" | "glass" | "metal" | "composite")
         swing: Swing direction ("inward_left" | "inward_right" | "outward_left" | "outward_right" | "sliding")
-        parts: Dict of door part names to mesh data
-        slots: List of slot definitions
-        tags: Classification tags
+        parts: Door parts (PartArray, shared read-only with the style template)
+        slots: Slot definitions (SlotArray, shared read-only with the style template)
+        tags: Classification tags (frozenset; serialized sorted)
         meta: Additional metadata
     """
     name: str
@@ -57,51 +203,54 @@ class DoorData(GridObjectMixin):
     style: str
     material: str
     swing: str
-    parts: Dict[str, Dict] = field(default_factory=dict)
-    slots: List[Dict] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    parts: PartArray = field(default_factory=PartArray)
+    slots: SlotArray = field(default_factory=SlotArray)
+    tags: FrozenSet[str] = frozenset()
     meta: Dict = field(default_factory=dict)
+    
+    @property
+    def slots_by_id(self) -> Mapping[str, Tuple[Mapping, ...]]:
+        """Read-only slot id -> slots index, prebuilt once per style template."""
+        # Doors still sharing their template's slots reuse its index
+        template = _DOOR_TEMPLATES.get((self.style, self.material, self.swing), {})
+        if self.slots is template.get("slots"):
+            return template["slots_by_id"]
+        return self.slots.index_by_id()
+    
+    def get_aabb(self) -> Dict:
+        """Axis-aligned bounding box in meters, offset from the part bounds."""
+        # Doors still sharing their template's parts reuse its precomputed bounds
+        template = _DOOR_TEMPLATES.get((self.style, self.material, self.swing), {})
+        local = template["aabb"] if self.parts is template.get("parts") else self.parts.bounds()
+        min_corner, max_corner = (np.asarray(self.grid_pos.to_meters()) + local).tolist()
+        return {"min": min_corner, "max": max_corner}
 
 
-def build_door(
-    style: str = "single",
-    material: str = "wood",
-    swing: str = "inward_left",
-    name: str = "door",
-    position: Optional[Tuple[float, float, float]] = None
-) -> DoorData:
-    """
-    Build a modular door with 4-part anatomy and slot system.
-    
-    Args:
-        style: Door style ("single" | "double" | "garage")
-        material: Leaf material ("wood" | "glass" | "metal" | "composite")
-        swing: Swing direction
-        name: Door identifier
-        position: Optional position in meters (x, y, z)
-    
-    Returns:
-        DoorData object with parts and slots
-    
-    Example:
-        >>> door = build_door(style="single", material="wood", swing="inward_left")
-        >>> len(door.parts)
-        4  # jamb_left, jamb_right, head, leaf
-        >>> len(door.slots)
-        4  # wall_interface, doorknob, hinge_top, hinge_bot
-    """
-    # Validate inputs
-    if style not in config.DOOR_STANDARDS:
-        raise ValueError(f"Invalid door style: {style}. Valid: {list(config.DOOR_STANDARDS.keys())}")
-    
-    valid_materials = ["wood", "glass", "metal", "composite"]
-    if material not in valid_materials:
-        raise ValueError(f"Invalid material: {material}. Valid: {valid_materials}")
-    
-    valid_swings = ["inward_left", "inward_right", "outward_left", "outward_right", "sliding"]
-    if swing not in valid_swings:
-        raise ValueError(f"Invalid swing: {swing}. Valid: {valid_swings}")
-    
+VALID_MATERIALS = frozenset({"wood", "glass", "metal", "composite"})
+VALID_SWINGS = frozenset({"inward_left", "inward_right", "outward_left", "outward_right", "sliding"})
+
+# door_id -> DoorData for doors with a Blender object, without keeping them alive.
+# Ids are generated per mesh, so doors sharing a name never collide.
+_DOOR_REGISTRY: "WeakValueDictionary[str, DoorData]" = WeakValueDictionary()
+
+# (style, material, swing) -> prebuilt grid_size/parts/slots/tags/meta/aabb
+# plus their JSON-ready forms, filled on the first build_door call
+_DOOR_TEMPLATES: Dict[Tuple[str, str, str], Dict] = {}
+
+
+def _read_only(columns):
+    """Freeze a PartArray/SlotArray in place: lists become tuples, arrays read-only."""
+    for f in fields(columns):
+        value = getattr(columns, f.name)
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        else:
+            setattr(columns, f.name, tuple(value))
+    return columns
+
+
+def _build_door_template(style: str, material: str, swing: str) -> Dict:
+    """Everything about a door except its name and position."""
     # Get standard dimensions
     dims = config.DOOR_STANDARDS[style]
     width = dims["w"]
@@ -113,113 +262,77 @@ def build_door(
     FRAME_DEPTH = 0.15      # 15cm frame depth (matches wall thickness)
     
     # Convert to grid coordinates
-    if position is None:
-        position = (0.0, 0.0, 0.0)
-    
-    grid_pos = GridPos.from_meters(*position, snap="meso")
     width_units = meters_to_units(width)
     height_units = meters_to_units(height)
     depth_units = meters_to_units(FRAME_DEPTH)
     
     grid_size = (width_units, depth_units, height_units)
     
-    # Build parts
-    parts = {
-        "frame_jamb_left": {
-            "type": "frame_vertical",
-            "position": [0.0, 0.0, 0.0],
-            "size": [FRAME_THICKNESS, FRAME_DEPTH, height],
-            "material": "frame_wood"
-        },
-        "frame_jamb_right": {
-            "type": "frame_vertical",
-            "position": [width - FRAME_THICKNESS, 0.0, 0.0],
-            "size": [FRAME_THICKNESS, FRAME_DEPTH, height],
-            "material": "frame_wood"
-        },
-        "frame_head": {
-            "type": "frame_horizontal",
-            "position": [0.0, 0.0, height - FRAME_THICKNESS],
-            "size": [width, FRAME_DEPTH, FRAME_THICKNESS],
-            "material": "frame_wood"
-        },
-        "door_leaf": {
-            "type": "leaf",
-            "position": [FRAME_THICKNESS, FRAME_DEPTH / 2, FRAME_THICKNESS],
-            "size": [width - 2 * FRAME_THICKNESS, LEAF_THICKNESS, height - 2 * FRAME_THICKNESS],
-            "material": material,
-            "swing": swing
-        }
-    }
-    
-    # Build slots
-    slots = []
-    
-    # 1. Wall interface slot (connects to wall opening)
-    wall_interface_slot = {
-        "id": "wall_interface",
-        "type": "door_opening",
-        "grid_pos": GridPos(
-            width_units // 2,
-            depth_units // 2,
-            height_units // 2
-        ),
-        "pos_meters": (width / 2, FRAME_DEPTH / 2, height / 2),
-        "size_meters": (width, height),
-        "required": True,
-        "occupied": False
-    }
-    slots.append(wall_interface_slot)
+    # Build parts: jamb_left, jamb_right, head, leaf
+    parts = PartArray(
+        names=["frame_jamb_left", "frame_jamb_right", "frame_head", "door_leaf"],
+        types=["frame_vertical", "frame_vertical", "frame_horizontal", "leaf"],
+        materials=["frame_wood", "frame_wood", "frame_wood", material],
+        swings=[None, None, None, swing],
+        positions=np.array([
+            [0.0, 0.0, 0.0],
+            [width - FRAME_THICKNESS, 0.0, 0.0],
+            [0.0, 0.0, height - FRAME_THICKNESS],
+            [FRAME_THICKNESS, FRAME_DEPTH / 2, FRAME_THICKNESS]
+        ]),
+        sizes=np.array([
+            [FRAME_THICKNESS, FRAME_DEPTH, height],
+            [FRAME_THICKNESS, FRAME_DEPTH, height],
+            [width, FRAME_DEPTH, FRAME_THICKNESS],
+            [width - 2 * FRAME_THICKNESS, LEAF_THICKNESS, height - 2 * FRAME_THICKNESS]
+        ])
+    )
     
-    # 2. Doorknob slot
-    knob_x = width - 0.1 if "left" in swing else 0.1
+    # Build slots: wall interface (connects to wall opening), doorknob, hinges
+    # Left-hinged doors put the knob on the right, and vice versa
+    knob_x, hinge_x = (width - 0.1, 0.05) if "left" in swing else (0.1, width - 0.05)
     knob_z = 0.95  # Standard handle height
     
-    doorknob_slot = {
-        "id": "doorknob",
-        "type": "door_hardware",
-        "grid_pos": GridPos.from_meters(knob_x, FRAME_DEPTH / 2, knob_z, snap="micro"),
-        "pos_meters": (knob_x, FRAME_DEPTH / 2, knob_z),
-        "size_meters": (0.06, 0.06),
-        "required": False,
-        "occupied": False
-    }
-    slots.append(doorknob_slot)
-    
-    # 3. Hinge slots
-    hinge_x = 0.05 if "left" in swing else width - 0.05
-    
-    hinge_top_slot = {
-        "id": "hinge_top",
-        "type": "door_hinge",
-        "grid_pos": GridPos.from_meters(hinge_x, FRAME_DEPTH / 2, height - 0.2, snap="micro"),
-        "pos_meters": (hinge_x, FRAME_DEPTH / 2, height - 0.2),
-        "size_meters": (0.04, 0.1),
-        "required": True,
-        "occupied": False
-    }
-    slots.append(hinge_top_slot)
-    
-    hinge_bot_slot = {
-        "id": "hinge_bot",
-        "type": "door_hinge",
-        "grid_pos": GridPos.from_meters(hinge_x, FRAME_DEPTH / 2, 0.3, snap="micro"),
-        "pos_meters": (hinge_x, FRAME_DEPTH / 2, 0.3),
-        "size_meters": (0.04, 0.1),
-        "required": True,
-        "occupied": False
-    }
-    slots.append(hinge_bot_slot)
+    slot_positions = np.array([
+        [width / 2, FRAME_DEPTH / 2, height / 2],
+        [knob_x, FRAME_DEPTH / 2, knob_z],
+        [hinge_x, FRAME_DEPTH / 2, height - 0.2],
+        [hinge_x, FRAME_DEPTH / 2, 0.3]
+    ])
+    
+    # Wall interface sits at the centre cell; hardware snaps to micro in one pass
+    slot_grid = np.empty((4, 3), dtype=np.int64)
+    slot_grid[0] = (width_units // 2, depth_units // 2, height_units // 2)
+    slot_grid[1:] = meters_to_grid(slot_positions[1:], snap="micro")
+    
+    slots = SlotArray(
+        ids=["wall_interface", "doorknob", "hinge_top", "hinge_bot"],
+        types=["door_opening", "door_hardware", "door_hinge", "door_hinge"],
+        grid_pos=slot_grid,
+        positions=slot_positions,
+        sizes=np.array([
+            [width, height],
+            [0.06, 0.06],
+            [0.04, 0.1],
+            [0.04, 0.1]
+        ]),
+        required=np.array([True, False, True, True]),
+        occupied=np.zeros(4, dtype=bool)
+    )
     
     # Build tags
-    tags = [
+    tags = frozenset([
         "arch_door",
         f"door_{style}",
         f"mat_{material}",
         f"swing_{swing}",
         f"size_{width}m",
         "modular_v2"
-    ]
+    ])
+    
+    # Local bounds, shared read-only with every door built from this template
+    aabb = parts.bounds()
+    aabb.setflags(write=False)
     
     # Build metadata
     meta = {
@@ -233,22 +346,91 @@ def build_door(
         "part_count": len(parts),
         "slot_count": len(slots),
         "aabb": {
-            "min": [0.0, 0.0, 0.0],
-            "max": [width, FRAME_DEPTH, height]
+            "min": aabb[0].tolist(),
+            "max": aabb[1].tolist()
         }
     }
     
+    return {
+        "grid_size": grid_size,
+        "parts": _read_only(parts),
+        "slots": _read_only(slots),
+        "parts_json": parts.to_dict(),
+        "slots_json": slots.to_list(),
+        "slots_by_id": slots.index_by_id(),
+        "tags": tags,
+        "tags_json": sorted(tags),
+        "aabb": aabb,
+        "meta": meta
+    }
+
+
+def _door_templates() -> Dict[Tuple[str, str, str], Dict]:
+    if not _DOOR_TEMPLATES:
+        for key in product(config.DOOR_STANDARDS, VALID_MATERIALS, VALID_SWINGS):
+            _DOOR_TEMPLATES[key] = _build_door_template(*key)
+    return _DOOR_TEMPLATES
+
+
+def build_door(
+    style: str = "single",
+    material: str = "wood",
+    swing: str = "inward_left",
+    name: str = "door",
+    position: Optional[Tuple[float, float, float]] = None
+) -> DoorData:
+    """
+    Build a modular door with 4-part anatomy and slot system.
+    
+    Args:
+        style: Door style ("single" | "double" | "garage")
+        material: Leaf material ("wood" | "glass" | "metal" | "composite")
+        swing: Swing direction
+        name: Door identifier
+        position: Optional position in meters (x, y, z)
+    
+    Returns:
+        DoorData object with parts and slots
+    
+    Example:
+        >>> door = build_door(style="single", material="wood", swing="inward_left")
+        >>> len(door.parts)
+        4  # jamb_left, jamb_right, head, leaf
+        >>> len(door.slots)
+        4  # wall_interface, doorknob, hinge_top, hinge_bot
+    """
+    template = _door_templates().get((style, material, swing))
+    
+    # Validate inputs
+    if template is None:
+        if style not in config.DOOR_STANDARDS:
+            raise ValueError(f"Invalid door style: {style}. Valid: {list(config.DOOR_STANDARDS.keys())}")
+        if material not in VALID_MATERIALS:
+            raise ValueError(f"Invalid material: {material}. Valid: {sorted(VALID_MATERIALS)}")
+        raise ValueError(f"Invalid swing: {swing}. Valid: {sorted(VALID_SWINGS)}")
+    
+    # Convert to grid coordinates
+    if position is None:
+        position = (0.0, 0.0, 0.0)
+    
+    grid_pos = GridPos.from_meters(*position, snap="meso")
+    
+    # Parts and slots are shared read-only with the template (copy() them
+    # before editing); tags are immutable and meta is a per-door copy
+    meta = dict(template["meta"])
+    meta["aabb"] = {bound: list(corner) for bound, corner in meta["aabb"].items()}
+    
     return DoorData(
         name=name,
         grid_pos=grid_pos,
-        grid_size=grid_size,
+        grid_size=template["grid_size"],
         snap_mode="meso",
         style=style,
         material=material,
         swing=swing,
-        parts=parts,
-        slots=slots,
-        tags=tags,
+        parts=template["parts"],
+        slots=template["slots"],
+        tags=template["tags"],
         meta=meta
     )
 
@@ -277,8 +459,12 @@ def generate_door_mesh(door_data: DoorData) -> Optional[object]:
     if bpy.context.scene.collection:
         bpy.context.scene.collection.objects.link(parent)
     
+    # Box corners for every part in one broadcast: (parts, 8, 3)
+    parts = door_data.parts
+    corners = parts.positions[:, None, :] + CUBE_VERTS * parts.sizes[:, None, :]
+    
     # Generate mesh for each part
-    for part_name, part_data in door_data.parts.items():
+    for part_name, part_type, material, verts in zip(parts.names, parts.types, parts.materials, corners.tolist()):
         mesh = bpy.data.meshes.new(f"{door_data.name}_{part_name}")
         obj = bpy.data.objects.new(f"{door_data.name}_{part_name}", mesh)
         
@@ -288,46 +474,18 @@ def generate_door_mesh(door_data: DoorData) -> Optional[object]:
         # Parent to main object
         obj.parent = parent
         
-        # Create box geometry
-        bm = bmesh.new()
-        
-        pos = part_data["position"]
-        size = part_data["size"]
-        
-        # Create cube and scale
-        bmesh.ops.create_cube(bm, size=1.0)
-        
-        # Scale and position
-        for v in bm.verts:
-            v.co.x = v.co.x * size[0] / 2 + pos[0] + size[0] / 2
-            v.co.y = v.co.y * size[1] / 2 + pos[1] + size[1] / 2
-            v.co.z = v.co.z * size[2] / 2 + pos[2] + size[2] / 2
-        
-        bm.to_mesh(mesh)
-        bm.free()
+        # Box geometry straight from the table, no bmesh round trip
+        mesh.from_pydata(verts, [], CUBE_FACES)
+        mesh.update(calc_edges=True)
         
         # Store part metadata
-        obj["part_type"] = part_data["type"]
-        obj["material_type"] = part_data["material"]
+        obj["part_type"] = part_type
+        obj["material_type"] = material
     
-    # Store metadata in parent
-    parent["door_data"] = json.dumps({
-        "style": door_data.style,
-        "material": door_data.material,
-        "swing": door_data.swing,
-        "parts": len(door_data.parts),
-        "slots": len(door_data.slots)
-    })
-    
-    if door_data.slots:
-        # Convert GridPos to serializable format
-        serializable_slots = []
-        for slot in door_data.slots:
-            slot_copy = slot.copy()
-            if "grid_pos" in slot_copy and hasattr(slot_copy["grid_pos"], "to_tuple"):
-                slot_copy["grid_pos"] = slot_copy["grid_pos"].to_tuple()
-            serializable_slots.append(slot_copy)
-        parent["slots_json"] = json.dumps(serializable_slots)
+    # Store metadata in parent: the door itself stays in the registry, and the
+    # record is enough to rebuild it in another session
+    for key, value in _door_record(door_data).items():
+        parent[key] = value
     
     # Mark as asset
     parent.asset_mark()
@@ -335,6 +493,46 @@ def generate_door_mesh(door_data: DoorData) -> Optional[object]:
     return parent
 
 
+def _door_record(door_data: DoorData) -> Dict:
+    """
+    Register the door under a fresh id and return the custom properties for
+    its parent object: the id plus what build_door needs to recreate it.
+    """
+    door_id = uuid4().hex
+    _DOOR_REGISTRY[door_id] = door_data
+    return {
+        "door_id": door_id,
+        "door_name": door_data.name,
+        "door_style": door_data.style,
+        "door_material": door_data.material,
+        "door_swing": door_data.swing,
+        "door_grid_pos": list(door_data.grid_pos.to_tuple())
+    }
+
+
+def door_from_object(obj) -> DoorData:
+    """
+    Get the DoorData behind a parent object made by generate_door_mesh().
+    
+    Returns the registered instance while it is alive, otherwise rebuilds the
+    door from the parent's record (e.g. after reopening a saved .blend).
+    A rebuilt door has its template's parts and slots; edits made to the
+    original after build_door are not recorded.
+    """
+    door_data = _DOOR_REGISTRY.get(obj["door_id"])
+    if door_data is not None:
+        return door_data
+    door_data = build_door(
+        style=obj["door_style"],
+        material=obj["door_material"],
+        swing=obj["door_swing"],
+        name=obj["door_name"]
+    )
+    door_data.grid_pos = GridPos(*obj["door_grid_pos"])
+    _DOOR_REGISTRY[obj["door_id"]] = door_data
+    return door_data
+
+
 def door_to_json(door_data: DoorData) -> str:
     """
     Serialize door data to JSON.
@@ -345,14 +543,10 @@ def door_to_json(door_data: DoorData) -> str:
     Returns:
         JSON string representation
     """
-    # Convert slots to serializable format
-    serializable_slots = []
-    for slot in door_data.slots:
-        slot_copy = slot.copy()
-        if "grid_pos" in slot_copy and hasattr(slot_copy["grid_pos"], "to_tuple"):
-            slot_copy["grid_pos"] = slot_copy["grid_pos"].to_tuple()
-        serializable_slots.append(slot_copy)
-    
+    # Doors still sharing their template's parts/slots reuse its JSON-ready form
+    template = _DOOR_TEMPLATES.get((door_data.style, door_data.material, door_data.swing), {})
+    parts = door_data.parts
+    slots = door_data.slots
     data = {
         "name": door_data.name,
         "grid_pos": door_data.grid_pos.to_tuple(),
@@ -361,12 +555,12 @@ def door_to_json(door_data: DoorData) -> str:
         "style": door_data.style,
         "material": door_data.material,
         "swing": door_data.swing,
-        "parts": door_data.parts,
-        "slots": serializable_slots,
-        "tags": door_data.tags,
+        "parts": template["parts_json"] if parts is template.get("parts") else parts.to_dict(),
+        "slots": template["slots_json"] if slots is template.get("slots") else slots.to_list(),
+        "tags": template["tags_json"] if door_data.tags is template.get("tags") else sorted(door_data.tags),
         "meta": door_data.meta
     }
-    return json.dumps(data, indent=2)
+    return jsonio.dumps(data).decode()
 
 
 # Material definitions for different door types
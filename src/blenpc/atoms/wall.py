@@ -1,40 +1,123 @@
 import math
-import hashlib
-import struct
 import json
-import os
+from functools import lru_cache
+import numpy as np
 try:
     import bpy
-    import bmesh
 except ImportError:
     bpy = None
-    bmesh = None
     
 from typing import List, Tuple, Dict, Optional
 
 # Expert Fix: Absolute imports for the package structure
-from .. import config
-
-def make_rng(seed: int, subsystem: str):
-    """Create a deterministic RNG for a specific subsystem."""
-    h = hashlib.sha256(f"{seed}:{subsystem}".encode()).digest()
-    sub_seed = struct.unpack('<Q', h[:8])[0]
-    import random
-    return random.Random(sub_seed)
-
-def golden_split(length: float, rng) -> float:
-    """Split a length using the Golden Ratio with slight deterministic variation."""
-    split_point = length / config.PHI
-    variation = (rng.random() - 0.5) * config.GOLDEN_RATIO_VARIATION * length
-    final_split = split_point + variation
-    return round(final_split / config.GRID_UNIT) * config.GRID_UNIT
+from .. import config, jsonio
+from ..mf_v5.jit import njit
+
+# splitmix64 constants
+_U64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+@lru_cache(maxsize=None)
+def _subsystem_key(subsystem: str) -> int:
+    """Stable 64-bit FNV-1a of the subsystem name (str hash() is salted per process)."""
+    h = 0xCBF29CE484222325
+    for byte in subsystem.encode():
+        h = ((h ^ byte) * 0x100000001B3) & _U64
+    return h
+
+# Unit box corners and quads; a box mesh is offset + CUBE_VERTS * size.
+# Quads are wound counter-clockwise seen from outside (bottom, top, front,
+# right, back, left).
+CUBE_VERTS = np.array([
+    (0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+    (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)
+], dtype=np.float64)
+CUBE_FACES = [(3, 2, 1, 0), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+
+def _scaled_cube(size, offset) -> List[List[float]]:
+    """Corners of the box spanning offset .. offset + size, ready for from_pydata."""
+    return (CUBE_VERTS * size + offset).tolist()
+
+def make_rng(seed: int, subsystem: str) -> int:
+    """Derive the deterministic uint64 sub-seed for a specific subsystem."""
+    x = ((seed * _GAMMA) ^ _subsystem_key(subsystem)) & _U64
+    x = ((x ^ (x >> 30)) * _MIX1) & _U64
+    x = ((x ^ (x >> 27)) * _MIX2) & _U64
+    return x ^ (x >> 31)
+
+_SM_GAMMA = np.uint64(_GAMMA)
+_SM_MIX1 = np.uint64(_MIX1)
+_SM_MIX2 = np.uint64(_MIX2)
+_SM_30, _SM_27, _SM_31, _SM_11 = np.uint64(30), np.uint64(27), np.uint64(31), np.uint64(11)
+
+# Reciprocals bound once so the kernel multiplies instead of divides
+_INV_PHI = 1.0 / config.PHI
+_INV_GRID_UNIT = 1.0 / config.GRID_UNIT
+
+# No fastmath on either kernel: it may reorder the float ops ahead of the
+# grid snap, and the JIT and plain paths must agree on snapped positions.
+@njit(cache=True, parallel=True)
+def _golden_split_kernel(sub_seeds, lengths, inv_phi, variation, grid_unit, inv_grid_unit):
+    """One splitmix64 draw per sub-seed, then the grid-snapped golden split."""
+    z = sub_seeds + _SM_GAMMA
+    z = (z ^ (z >> _SM_30)) * _SM_MIX1
+    z = (z ^ (z >> _SM_27)) * _SM_MIX2
+    z = z ^ (z >> _SM_31)
+    r = (z >> _SM_11) * (1.0 / 9007199254740992.0)  # top 53 bits -> [0, 1)
+    split = lengths * inv_phi + (r - 0.5) * variation * lengths
+    return np.round(split * inv_grid_unit) * grid_unit
+
+@njit(cache=True)
+def _golden_split_point(length, r, inv_phi, variation, grid_unit, inv_grid_unit):
+    """Scalar twin of _golden_split_kernel for one wall and its draw r in [0, 1)."""
+    split = length * inv_phi + (r - 0.5) * variation * length
+    return np.round(split * inv_grid_unit) * grid_unit
+
+def _unit_draw(sub_seed: int) -> float:
+    """The splitmix64 draw of _golden_split_kernel, on Python ints."""
+    z = (sub_seed + _GAMMA) & _U64
+    z = ((z ^ (z >> 30)) * _MIX1) & _U64
+    z = ((z ^ (z >> 27)) * _MIX2) & _U64
+    z ^= z >> 31
+    return (z >> 11) * (1.0 / 9007199254740992.0)
+
+def _golden_split_batch(seeds: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """golden_split for many walls at once; seeds are make_rng sub-seeds."""
+    return _golden_split_kernel(
+        np.asarray(seeds, dtype=np.uint64),
+        np.asarray(lengths, dtype=np.float64),
+        _INV_PHI,
+        config.GOLDEN_RATIO_VARIATION,
+        config.GRID_UNIT,
+        _INV_GRID_UNIT,
+    )
+
+def golden_split(length: float, rng: int) -> float:
+    """Split a length using the Golden Ratio with slight deterministic variation.
+
+    ``rng`` is the sub-seed returned by make_rng.
+    """
+    return float(_golden_split_point(
+        float(length),
+        _unit_draw(rng),
+        _INV_PHI,
+        config.GOLDEN_RATIO_VARIATION,
+        config.GRID_UNIT,
+        _INV_GRID_UNIT,
+    ))
 
 def check_manifold(bm) -> bool:
-    """Verify if the mesh is a manifold using Euler's Formula: V - E+ F = 2."""
+    """Verify if the mesh is a manifold using Euler's Formula: V - E+ F = 2.
+
+    Accepts a bmesh or a bpy mesh with its edges calculated.
+    """
     if not bm: return False
-    v = len(bm.verts)
-    e = len(bm.edges)
-    f = len(bm.faces)
+    if hasattr(bm, "polygons"):
+        v, e, f = len(bm.vertices), len(bm.edges), len(bm.polygons)
+    else:
+        v, e, f = len(bm.verts), len(bm.edges), len(bm.faces)
     return (v - e + f) == 2
 
 def validate_slot(slot: Dict, slot_types_file: str = None) -> bool:
@@ -42,12 +125,10 @@ def validate_slot(slot: Dict, slot_types_file: str = None) -> bool:
     if slot_types_file is None:
         slot_types_file = config.SLOTS_FILE
         
-    if not os.path.exists(slot_types_file):
+    slot_types = jsonio.load_cached(slot_types_file)
+    if slot_types is None:
         return True
     
-    with open(slot_types_file, 'r') as f:
-        slot_types = json.load(f)
-    
     slot_type = slot.get("type")
     if slot_type not in slot_types.get("types", {}):
         raise ValueError(f"Unknown slot type: {slot_type}")
@@ -65,32 +146,20 @@ def create_engineered_wall(name: str, length: float, seed: int = 0):
         raise ImportError("Blender 'bpy' module is required for this function.")
         
     rng = make_rng(seed, "wall_slots")
-    bpy.ops.wm.read_factory_settings(use_empty=True)
     
     mesh = bpy.data.meshes.new(name)
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.scene.collection.objects.link(obj)
     
-    bm = bmesh.new()
-    bmesh.ops.create_cube(bm, size=1.0)
-    
     thickness = config.WALL_THICKNESS_BASE
     height = config.STORY_HEIGHT
     
-    bm.verts.ensure_lookup_table()
-    for v in bm.verts:
-        v.co.x *= length
-        v.co.y *= thickness
-        v.co.z *= height
-        v.co.z += height / 2
-        v.co.x += length / 2
-        
-    if not check_manifold(bm):
-        bm.free()
+    # x along the wall from 0, centred on y, standing on z=0
+    mesh.from_pydata(_scaled_cube((length, thickness, height), (0.0, -thickness / 2, 0.0)), [], CUBE_FACES)
+    mesh.update(calc_edges=True)
+    
+    if not check_manifold(mesh):
         raise Exception(f"Manifold check failed for {name}")
-        
-    bm.to_mesh(mesh)
-    bm.free()
     
     primary_slot_x = golden_split(length, rng)
     slots = [
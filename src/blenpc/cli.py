@@ -7,6 +7,7 @@ import platform
 import subprocess
 import time
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict
 from pathlib import Path
 
@@ -16,37 +17,46 @@ src_dir = os.path.join(PROJECT_ROOT, "src")
 if src_dir not in sys.path:
     sys.path.append(src_dir)
 
-from blenpc import config
+from blenpc import config, daemon as blender_daemon, jsonio
+from blenpc.engine.inventory_manager import InventoryManager
+from blenpc.mf_v5.export import ExportSettings, export_manifest
 
-def run_blender_task(input_data: Dict, input_file: str, output_file: str, preview: bool = False) -> Dict:
-    """Helper to run a single Blender task using the standardized run_command.py."""
-    with open(input_file, 'w') as f:
-        json.dump(input_data, f)
-        
-    # Expert Fix: Correct path to run_command.py inside src/blenpc
-    run_cmd_path = os.path.join(PROJECT_ROOT, "src", "blenpc", "run_command.py")
+def _read_result(stdout: bytes) -> Optional[Dict]:
+    """Pick out the result line run_command.py prints after Blender's own output."""
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(config.CLI_RESULT_PREFIX):
+            return jsonio.loads(line[len(config.CLI_RESULT_PREFIX):])
+    return None
+
+def run_blender_task(input_data: Dict, preview: bool = False, use_daemon: bool = True) -> Dict:
+    """Helper to run a single Blender task using the standardized run_command.py.
+
+    Uses the `blenpc daemon` Blender when one is running; otherwise the command
+    goes in on a fresh Blender's stdin and the result comes back on its stdout.
+    """
+    if use_daemon and not preview:
+        res = blender_daemon.request(input_data)
+        if res is not None:
+            return res
+
+    run_cmd_path = os.path.join(PROJECT_ROOT, "run_command.py")
     
     blender_cmd = [config.BLENDER_PATH]
     if not preview:
         blender_cmd.append("--background")
     
-    blender_cmd.extend(["--python", run_cmd_path, "--", input_file, output_file])
+    blender_cmd.extend(["--python", run_cmd_path])
     
     try:
-        # Expert Fix: Capture stderr for debugging
-        result = subprocess.run(blender_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        if os.path.exists(output_file):
-            with open(output_file, 'r') as f:
-                return json.load(f)
-        else:
-            return {"status": "error", "message": f"Blender did not produce output. Stderr: {result.stderr}"}
+        result = subprocess.run(blender_cmd, input=jsonio.dumps(input_data), capture_output=True, check=True)
+        output = _read_result(result.stdout)
+        if output is None:
+            return {"status": "error", "message": f"Blender did not produce output. Stderr: {result.stderr.decode(errors='replace')}"}
+        return output
     except subprocess.CalledProcessError as e:
-        return {"status": "error", "message": f"Blender process failed: {e.stderr}"}
+        return {"status": "error", "message": f"Blender process failed: {e.stderr.decode(errors='replace')}"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
-    finally:
-        if os.path.exists(input_file): os.remove(input_file)
-        if os.path.exists(output_file): os.remove(output_file)
 
 @click.group()
 @click.version_option(version="5.1.1")
@@ -56,8 +66,11 @@ def cli(verbose, blender_path):
     """BlenPC v5.1.1 - Expert-Driven Procedural Building Generator"""
     if verbose:
         os.environ["MF_LOG_LEVEL"] = "DEBUG"
+    config.configure_logging("DEBUG" if verbose else None)
     if blender_path:
         os.environ["BLENDER_PATH"] = blender_path
+        # BLENDER_PATH was resolved (and cached) when config was imported
+        config.BLENDER_PATH = blender_path
 
 @cli.command()
 @click.option('--width', '-w', type=float, help="Building width in meters.")
@@ -68,7 +81,9 @@ def cli(verbose, blender_path):
 @click.option('--output', '-o', type=click.Path(), default='./output', help="Output directory.")
 @click.option('--spec', type=click.Path(exists=True), help="Path to YAML/JSON spec file.")
 @click.option('--preview', is_flag=True, help="Open in Blender GUI after generation.")
-def generate(width, depth, floors, seed, roof, output, spec, preview):
+@click.option('--format', 'formats', type=click.Choice(config.EXPORT_FORMATS_SUPPORTED, case_sensitive=False), multiple=True, default=['glb'], help="Export format; repeat for several.")
+@click.option('--jobs', '-j', type=int, default=1, help="Export formats in up to N parallel Blender processes.")
+def generate(width, depth, floors, seed, roof, output, spec, preview, formats, jobs):
     """Generate a procedural building."""
     if spec:
         with open(spec, 'r') as f:
@@ -86,14 +101,45 @@ def generate(width, depth, floors, seed, roof, output, spec, preview):
         "seed": seed,
         "spec": {"width": width or 20.0, "depth": depth or 16.0, "floors": floors or 1, "roof": roof, "output_dir": output}
     }
+    formats = [fmt.lower() for fmt in formats]
     
     click.echo(f"Generating building (Seed: {seed})...")
-    res = run_blender_task(input_data, f"gen_{seed}.json", f"out_{seed}.json", preview)
-    
-    if res.get("status") == "success":
-        click.secho(f"✓ Success: {res['result']['glb_path']}", fg="green")
+    parallel = jobs > 1 and len(formats) > 1 and not preview
+    if parallel:
+        # Generation is deterministic per seed, so each worker Blender rebuilds
+        # the building and writes only its own format. The first worker also
+        # writes the collider; the manifest is written here once all succeed.
+        def run_format(fmt):
+            spec = dict(input_data["spec"], formats=[fmt], collider=fmt == formats[0], manifest=False)
+            try:
+                return run_blender_task(dict(input_data, spec=spec), use_daemon=False)
+            except Exception as e:
+                return {"status": "error", "message": f"{fmt} export failed: {e}"}
+
+        with ThreadPoolExecutor(max_workers=min(jobs, len(formats))) as pool:
+            results = list(pool.map(run_format, formats))
     else:
-        click.secho(f"✗ Error: {res.get('message')}", fg="red")
+        input_data["spec"]["formats"] = formats
+        results = [run_blender_task(input_data, preview)]
+    
+    failed = 0
+    exports = {}
+    for res in results:
+        if res.get("status") == "success":
+            exports.update(res['result'].get('exports', {}))
+            paths = list(res['result'].get('exports', {}).values()) or [res['result']['glb_path']]
+            for path in paths:
+                click.secho(f"✓ Success: {path}", fg="green")
+        else:
+            failed += 1
+            click.secho(f"✗ Error: {res.get('message')}", fg="red")
+    
+    if parallel:
+        if failed:
+            # A manifest listing only some formats would look like a full export
+            click.secho(f"✗ {failed} of {len(results)} formats failed; export manifest not written.", fg="red")
+            sys.exit(1)
+        export_manifest(Path(output) / "export_manifest.json", "Building", ExportSettings(), exports)
 
 @cli.command()
 @click.option('--spec', type=click.Path(exists=True), required=True, help="Path to batch spec file.")
@@ -117,7 +163,37 @@ def batch(spec):
                     "output_dir": common_output
                 }
             }
-            run_blender_task(input_data, f"batch_{seed}.json", f"out_{seed}.json")
+            run_blender_task(input_data)
+
+@cli.command()
+@click.option('--stop', is_flag=True, help="Stop the running daemon.")
+def daemon(stop):
+    """Keep one background Blender running to serve generate/batch calls."""
+    if stop:
+        res = blender_daemon.request({"command": "shutdown"})
+        if res is None:
+            click.echo("No daemon running.")
+        else:
+            click.echo("Daemon stopped." if res.get("status") == "success" else f"Daemon did not stop: {res.get('message')}")
+        return
+    if blender_daemon.request({"command": "ping"}):
+        click.echo(f"Daemon already running on {config.DAEMON_SOCKET}")
+        return
+
+    daemon_path = os.path.join(PROJECT_ROOT, "daemon.py")
+    proc = subprocess.Popen(
+        [config.BLENDER_PATH, "--background", "--python", daemon_path],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.time() + config.DAEMON_START_TIMEOUT
+    while time.time() < deadline and proc.poll() is None:
+        res = blender_daemon.request({"command": "ping"})
+        if res and res.get("status") == "success":
+            click.secho(f"✓ Daemon listening on {config.DAEMON_SOCKET} (pid {proc.pid})", fg="green")
+            return
+        time.sleep(0.2)
+    click.secho("✗ Error: Blender daemon did not start.", fg="red")
 
 @cli.command()
 @click.argument('path', type=click.Path(exists=True))
@@ -133,9 +209,8 @@ def registry():
 @registry.command(name='list')
 def list_assets():
     """List registered assets."""
-    if os.path.exists(config.INVENTORY_FILE):
-        with open(config.INVENTORY_FILE, 'r') as f:
-            inv = json.load(f)
+    inv = InventoryManager.load_inventory()
+    if inv is not None:
         for name in inv.get('assets', {}):
             click.echo(f"  - {name}")
     else:
@@ -1,6 +1,10 @@
 import os
 import platform
 import logging
+import functools
+import getpass
+import shutil
+import tempfile
 from typing import Any, Dict
 
 """BlenPC v5.1.1 - Core Configuration System."""
@@ -10,16 +14,22 @@ LOG_LEVEL = os.getenv("MF_LOG_LEVEL", "INFO")
 LOG_FILE = os.getenv("MF_LOG_FILE", None)
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s [%(filename)s:%(lineno)d] - %(message)s'
 
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_FILE) if LOG_FILE else logging.NullHandler()
-    ]
-)
 logger = logging.getLogger("blenpc")
 
+def configure_logging(level: str = None):
+    """Install the log handlers; called by entry points, not on import."""
+    if getattr(configure_logging, "_done", False):
+        return
+    logging.basicConfig(
+        level=getattr(logging, level or LOG_LEVEL),
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(LOG_FILE) if LOG_FILE else logging.NullHandler()
+        ]
+    )
+    configure_logging._done = True
+
 # --- 2. PATH MANAGEMENT ---
 PACKAGE_ROOT = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(PACKAGE_ROOT))
@@ -27,31 +37,44 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(PACKAGE_ROOT))
 LIBRARY_DIR = os.path.join(PROJECT_ROOT, "_library")
 REGISTRY_DIR = os.path.join(PROJECT_ROOT, "_registry")
 INVENTORY_FILE = os.path.join(REGISTRY_DIR, "inventory.json")
+INVENTORY_LOG_FILE = os.path.join(REGISTRY_DIR, "inventory.log")
 SLOTS_FILE = os.path.join(REGISTRY_DIR, "slot_types.json")
 TAGS_FILE = os.path.join(REGISTRY_DIR, "tag_vocabulary.json")
 
 # --- 3. BLENDER EXECUTABLE ---
+@functools.lru_cache(maxsize=1)
 def get_blender_path():
     env_path = os.getenv("BLENDER_PATH") or os.getenv("BLENDER_EXECUTABLE")
-    if env_path and os.path.exists(env_path):
+    if env_path and os.path.isfile(env_path):
         return env_path
     
-    if platform.system() == "Windows":
+    system = platform.system()
+    if system == "Windows":
         paths = [
             r"C:\Program Files\Blender Foundation\Blender 5.0\blender.exe",
             r"C:\Program Files\Blender Foundation\Blender 4.3\blender.exe",
             os.path.expandvars(r"%APPDATA%\Blender Foundation\Blender\blender.exe")
         ]
-        for p in paths:
-            if os.path.exists(p): return p
-        return "blender.exe"
-    elif platform.system() == "Darwin":
+        return next((p for p in paths if os.path.isfile(p)), None) or shutil.which("blender") or "blender.exe"
+    elif system == "Darwin":
         return "/Applications/Blender.app/Contents/MacOS/Blender"
     else:
-        return "/usr/bin/blender"
+        return shutil.which("blender") or "/usr/bin/blender"
 
 BLENDER_PATH = get_blender_path()
 HEADLESS_ARGS = ["--background", "--python"]
+# run_command.py prints its JSON result on a stdout line starting with this,
+# after whatever Blender itself logs
+CLI_RESULT_PREFIX = b"BLENPC_RESULT "
+# Socket of the persistent Blender started by `blenpc daemon`; without
+# XDG_RUNTIME_DIR it lives in a per-user 0700 directory under the temp dir
+DAEMON_SOCKET_DIR = os.getenv("XDG_RUNTIME_DIR") or os.path.join(
+    tempfile.gettempdir(), f"blenpc-{os.getuid() if hasattr(os, 'getuid') else getpass.getuser()}"
+)
+DAEMON_SOCKET = os.path.join(DAEMON_SOCKET_DIR, "blenpc-daemon.sock")
+DAEMON_START_TIMEOUT = 60
+# Seconds a CLI call waits on the daemon before giving up
+DAEMON_REQUEST_TIMEOUT = 600
 
 # --- 4. PERFORMANCE & LIMITS ---
 MAX_WORKER_PROCESSES = os.cpu_count() or 4
@@ -100,8 +123,9 @@ GOLDEN_RATIO_VARIATION = 0.04
 
 # --- 7. INVENTORY LOCKING ---
 INVENTORY_LOCK_TIMEOUT = 5
-INVENTORY_LOCK_POLL_INTERVAL = 0.1
+INVENTORY_LOCK_POLL_INTERVAL = 0.05  # Backoff cap; retries start at 1ms
 INVENTORY_LOCK_STALE_AGE = 60
+INVENTORY_LOG_COMPACT_SIZE = 1 << 20  # Fold inventory.log into inventory.json past 1 MiB
 
 # --- 8. EXPORT SETTINGS ---
 EXPORT_FORMATS_SUPPORTED = ["glb", "blend", "fbx", "obj"]
@@ -0,0 +1,121 @@
+"""Long-running Blender process that serves CLI commands over a unix socket.
+
+Started by ``blenpc daemon`` as ``blender --background --python daemon.py``.
+Each connection carries one JSON command; the client shuts down its write
+side, the daemon runs the command through run_command.execute and replies
+with the JSON result.
+"""
+
+import os
+import socket
+import sys
+from typing import Dict, Optional
+
+# Add src/ to path so 'blenpc' can be imported inside Blender
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.dirname(current_dir)
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from blenpc import config, jsonio
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def request(
+    command_data: Dict,
+    path: str = config.DAEMON_SOCKET,
+    timeout: float = config.DAEMON_REQUEST_TIMEOUT,
+) -> Optional[Dict]:
+    """Send one command to a running daemon; None when no daemon answers.
+
+    A daemon that accepts the command but does not reply within ``timeout``
+    seconds gives an error result, so the command is not run a second time.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(jsonio.dumps(command_data))
+            sock.shutdown(socket.SHUT_WR)
+            reply = _recv_all(sock)
+    except socket.timeout:
+        return {"status": "error", "message": f"Daemon did not answer within {timeout}s"}
+    except OSError:
+        # No socket, or a stale one left by a daemon that died
+        return None
+    return jsonio.loads(reply) if reply else None
+
+
+def _private_socket_dir(directory: str):
+    """Create the socket directory 0700, refusing one another user can reach."""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.stat(directory)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"Daemon socket directory {directory} must be private to the current user")
+
+
+def serve(path: str = config.DAEMON_SOCKET):
+    """Accept commands until a 'shutdown' command arrives."""
+    import bpy
+    from blenpc.engine.inventory_manager import InventoryManager
+    from blenpc.run_command import execute
+
+    config.configure_logging()
+    _private_socket_dir(os.path.dirname(path))
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket 0600 rather than chmod it after bind
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    config.logger.info(f"blenpc daemon listening on {path}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    command_data = jsonio.loads(_recv_all(conn))
+                except ValueError as e:
+                    conn.sendall(jsonio.dumps({"status": "error", "message": f"Invalid command payload: {e}"}))
+                    continue
+
+                cmd = command_data.get("command")
+                if cmd == "shutdown":
+                    conn.sendall(jsonio.dumps({"status": "success", "result": "shutdown"}))
+                    break
+                if cmd == "ping":
+                    conn.sendall(jsonio.dumps({"status": "success", "result": "pong"}))
+                    continue
+
+                # Every command starts from an empty scene, like a fresh Blender
+                bpy.ops.wm.read_factory_settings(use_empty=True)
+                conn.sendall(jsonio.dumps(execute(command_data)))
+    finally:
+        server.close()
+        # Registrations were only appended to the log while serving
+        InventoryManager.compact()
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+if __name__ == "__main__":
+    serve()
@@ -1,6 +1,6 @@
 """Asset management and slot placement engine"""
 
 from .inventory_manager import InventoryManager
-from .slot_engine import get_aabb, find_asset, place_on_slot
+from .slot_engine import SlotIndex, get_aabb, find_asset, place_on_slot
 
-__all__ = ["InventoryManager", "get_aabb", "find_asset", "place_on_slot"]
+__all__ = ["InventoryManager", "SlotIndex", "get_aabb", "find_asset", "place_on_slot"]
@@ -248,7 +248,8 @@ class SceneGrid:
                     "grid_pos": obj.grid_pos.to_tuple(),
                     "grid_size": obj.grid_size,
                     "snap_mode": obj.snap_mode,
-                    "tags": obj.tags
+                    # Tag sets (e.g. door tags) serialize as sorted lists
+                    "tags": sorted(obj.tags) if isinstance(obj.tags, (set, frozenset)) else obj.tags
                 }
                 for name, obj in self._objects.items()
             }
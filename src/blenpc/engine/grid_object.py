@@ -12,7 +12,9 @@ Key Concepts:
 """
 
 from typing import Protocol, Set, Tuple, List, Dict, Optional
+import numpy as np
 from .grid_pos import GridPos
+from ..mf_v5.jit import njit
 
 
 class IGridObject(Protocol):
@@ -64,6 +66,18 @@ class IGridObject(Protocol):
         ...
 
 
+@njit(cache=True)
+def _footprint_cells(origin: np.ndarray, size: np.ndarray) -> np.ndarray:
+    """(sx*sy*sz, 3) cell coordinates of the box at origin, z varying fastest."""
+    sy, sz = size[1], size[2]
+    idx = np.arange(size[0] * sy * sz)
+    cells = np.empty((idx.shape[0], 3), dtype=np.int64)
+    cells[:, 0] = origin[0] + idx // (sy * sz)
+    cells[:, 1] = origin[1] + (idx // sz) % sy
+    cells[:, 2] = origin[2] + idx % sz
+    return cells
+
+
 class GridObjectMixin:
     """
     Mixin class providing default implementations of IGridObject methods.
@@ -81,16 +95,10 @@ class GridObjectMixin:
     
     def get_footprint(self) -> Set[Tuple[int, int, int]]:
         """Default footprint implementation - full AABB."""
-        px, py, pz = self.grid_pos.x, self.grid_pos.y, self.grid_pos.z
-        sx, sy, sz = self.grid_size
-        
-        footprint = set()
-        for dx in range(sx):
-            for dy in range(sy):
-                for dz in range(sz):
-                    footprint.add((px + dx, py + dy, pz + dz))
-        
-        return footprint
+        origin = np.array([self.grid_pos.x, self.grid_pos.y, self.grid_pos.z], dtype=np.int64)
+        cells = _footprint_cells(origin, np.array(self.grid_size, dtype=np.int64))
+        # One tolist per axis, then zip into tuples of Python ints
+        return set(zip(*cells.T.tolist()))
     
     def validate_placement(self, scene: "SceneGrid") -> bool:
         """Default placement validation - check if all cells are free."""
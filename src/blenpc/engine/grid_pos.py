@@ -14,6 +14,9 @@ Key Concepts:
 
 from typing import Tuple, Optional
 from dataclasses import dataclass
+
+import numpy as np
+
 from .. import config
 
 
@@ -149,6 +152,24 @@ def meters_to_units(meters: float) -> int:
     return round(meters / config.MICRO_UNIT)
 
 
+def meters_to_grid(coords: np.ndarray, snap: str = "meso") -> np.ndarray:
+    """
+    Vectorized GridPos.from_meters for an (N, 3) array of metric coordinates.
+    
+    Returns:
+        (N, 3) int64 array of snapped grid coordinates
+    """
+    if snap not in config.SNAP_MODES:
+        raise ValueError(
+            f"Invalid snap mode '{snap}'. "
+            f"Valid modes: {list(config.SNAP_MODES.keys())}"
+        )
+    
+    snap_unit = config.SNAP_MODES[snap] * config.MICRO_UNIT
+    snapped = np.round(np.asarray(coords, dtype=np.float64) / snap_unit) * snap_unit
+    return np.round(snapped / config.MICRO_UNIT).astype(np.int64)
+
+
 def units_to_meters(units: int) -> float:
     """Convert grid units to meters."""
     return units * config.MICRO_UNIT
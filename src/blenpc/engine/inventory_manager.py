@@ -1,13 +1,81 @@
-import json
+import copy
 import os
 import time
 from typing import List, Dict, Optional
 
 # Expert Fix: Absolute imports for the package structure
-from .. import config
+from .. import config, jsonio
     
 LOCK_FILE = os.path.join(config.REGISTRY_DIR, ".inventory.lock")
 
+# Inventory document and log state the merged view was built from
+_merged_source = None
+_merged_log_key = None
+_merged_inventory = None
+
+def _replay_log(inventory: Optional[Dict], torn: Optional[List[bytes]] = None) -> Optional[Dict]:
+    """Apply inventory.log entries on top of a copy of the inventory document.
+
+    Lines that do not parse are skipped and, when ``torn`` is given, appended
+    to it.
+    """
+    try:
+        with open(config.INVENTORY_LOG_FILE, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return inventory
+    
+    merged = dict(inventory or {"version": "1.1"})
+    assets = merged["assets"] = dict(merged.get("assets", {}))
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            entry = jsonio.loads(line)
+        except ValueError:
+            # Torn write from a crashed process
+            if torn is not None:
+                torn.append(line)
+            continue
+        if entry.get("op") == "put":
+            assets[entry["name"]] = entry["data"]
+            merged["last_updated"] = entry["ts"]
+    return merged
+
+# Inventory document the tag index was built from, tag -> asset names, and
+# asset name -> registry order
+_indexed_inventory = None
+_TAG_INDEX: Dict[str, set] = {}
+_ASSET_ORDER: Dict[str, int] = {}
+
+def _tag_index(inventory: Dict):
+    """Inverted tag index for the cached inventory, rebuilt when the file changes."""
+    global _indexed_inventory, _TAG_INDEX, _ASSET_ORDER
+    if inventory is not _indexed_inventory:
+        index = {}
+        order = {}
+        for asset_name, asset_data in inventory.get("assets", {}).items():
+            order[asset_name] = len(order)
+            for tag in asset_data.get("tags", []):
+                index.setdefault(tag, set()).add(asset_name)
+        _indexed_inventory, _TAG_INDEX, _ASSET_ORDER = inventory, index, order
+    return _TAG_INDEX, _ASSET_ORDER
+
+def _current_inventory() -> Optional[Dict]:
+    """Shared merged inventory view; callers must not mutate it."""
+    global _merged_source, _merged_log_key, _merged_inventory
+    inventory = jsonio.load_cached(config.INVENTORY_FILE)
+    try:
+        st = os.stat(config.INVENTORY_LOG_FILE)
+    except FileNotFoundError:
+        return inventory
+    
+    log_key = (st.st_mtime_ns, st.st_size)
+    if inventory is not _merged_source or log_key != _merged_log_key:
+        _merged_inventory = _replay_log(inventory)
+        _merged_source, _merged_log_key = inventory, log_key
+    return _merged_inventory
+
 class InventoryManager:
     @staticmethod
     def acquire_lock(timeout=None):
@@ -16,70 +84,140 @@ class InventoryManager:
             timeout = config.INVENTORY_LOCK_TIMEOUT
             
         start_time = time.time()
-        while os.path.exists(LOCK_FILE):
-            if os.path.exists(LOCK_FILE):
-                lock_age = time.time() - os.path.getmtime(LOCK_FILE)
-                if lock_age > config.INVENTORY_LOCK_STALE_AGE:
-                    try:
-                        os.remove(LOCK_FILE)
-                    except:
-                        pass
+        backoff = 0.001
+        while True:
+            # O_EXCL makes check-and-create a single atomic syscall
+            try:
+                fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                pass
+            else:
+                with os.fdopen(fd, "w") as f:
+                    f.write(str(os.getpid()))
+                return
+            
+            try:
+                lock_age = time.time() - os.stat(LOCK_FILE).st_mtime
+            except FileNotFoundError:
+                # Released between our open and stat; retry immediately
+                continue
+            if lock_age > config.INVENTORY_LOCK_STALE_AGE:
+                try:
+                    os.remove(LOCK_FILE)
+                except OSError:
+                    pass
+                continue
             
             if time.time() - start_time > timeout:
                 raise TimeoutError("Could not acquire inventory lock")
-            time.sleep(config.INVENTORY_LOCK_POLL_INTERVAL)
-        
-        with open(LOCK_FILE, "w") as f:
-            f.write(str(os.getpid()))
+            time.sleep(backoff)
+            backoff = min(backoff * 2, config.INVENTORY_LOCK_POLL_INTERVAL)
 
     @staticmethod
     def release_lock():
         """Release the inventory file lock."""
-        if os.path.exists(LOCK_FILE):
-            try:
-                os.remove(LOCK_FILE)
-            except:
-                pass
+        try:
+            os.remove(LOCK_FILE)
+        except OSError:
+            pass
+
+    @staticmethod
+    def load_inventory() -> Optional[Dict]:
+        """Current inventory: inventory.json plus any entries still in inventory.log.
+
+        Returns a private copy; edits do not reach the parse cache.
+        """
+        return copy.deepcopy(_current_inventory())
 
     @staticmethod
     def find_asset(tags: List[str]) -> Optional[Dict]:
         """Find an asset matching all tags using the registry."""
-        if not os.path.exists(config.INVENTORY_FILE):
+        inventory = _current_inventory()
+        if inventory is None:
             return None
             
-        with open(config.INVENTORY_FILE, "r") as f:
-            inventory = json.load(f)
+        assets = inventory.get("assets", {})
+        if not tags:
+            return copy.deepcopy(next(iter(assets.values()), None))
             
-        for asset_name, asset_data in inventory.get("assets", {}).items():
-            asset_tags = asset_data.get("tags", [])
-            if all(tag in asset_tags for tag in tags):
-                return asset_data
-        return None
+        index, order = _tag_index(inventory)
+        candidates = set.intersection(*(index.get(tag, set()) for tag in tags))
+        if not candidates:
+            return None
+        # First match in registry order, as a linear scan would return; copied
+        # so callers can edit it before register_asset
+        return copy.deepcopy(assets[min(candidates, key=order.__getitem__)])
 
     @staticmethod
     def register_asset(asset_data: Dict):
-        """Add or update an asset in the inventory with locking."""
+        """Add or update an asset by appending it to the inventory log with locking."""
+        entry = {
+            "op": "put",
+            "name": asset_data["name"],
+            "data": asset_data,
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S")
+        }
         InventoryManager.acquire_lock()
         try:
-            inventory = {"version": "1.1", "assets": {}}
-            if os.path.exists(config.INVENTORY_FILE):
-                with open(config.INVENTORY_FILE, "r") as f:
-                    inventory = json.load(f)
-            
-            name = asset_data["name"]
-            inventory["assets"][name] = asset_data
-            inventory["last_updated"] = time.strftime("%Y-%m-%dT%H:%M:%S")
-            
             os.makedirs(config.REGISTRY_DIR, exist_ok=True)
+            with open(config.INVENTORY_LOG_FILE, "a+b") as f:
+                # Terminate a torn tail so this entry starts on its own line
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                f.write(jsonio.dumps(entry) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+                log_size = f.tell()
+        finally:
+            InventoryManager.release_lock()
+        
+        if log_size > config.INVENTORY_LOG_COMPACT_SIZE:
+            InventoryManager.compact()
+
+    @staticmethod
+    def compact():
+        """Fold inventory.log into inventory.json and snapshot a backup."""
+        # Nothing logged: skip the lock (and the registry dir it lives in)
+        try:
+            os.stat(config.INVENTORY_LOG_FILE)
+        except FileNotFoundError:
+            return
+        
+        InventoryManager.acquire_lock()
+        try:
+            inventory = None
+            try:
+                with open(config.INVENTORY_FILE, "rb") as f:
+                    inventory = jsonio.loads(f.read())
+            except FileNotFoundError:
+                pass
+            torn: List[bytes] = []
+            merged = _replay_log(inventory, torn)
+            if merged is inventory:
+                # Another process compacted while we waited for the lock
+                return
+            inventory = merged
             
-            with open(config.INVENTORY_FILE, "w") as f:
-                json.dump(inventory, f, indent=2)
+            # Write-then-rename so readers never see a half-written file
+            tmp_file = config.INVENTORY_FILE + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(jsonio.dumps(inventory))
+            os.replace(tmp_file, config.INVENTORY_FILE)
+            if torn:
+                # Keep unreadable entries for inspection rather than drop them
+                torn_file = config.INVENTORY_LOG_FILE + f".{time.strftime('%Y%m%d%H%M%S')}.torn"
+                os.replace(config.INVENTORY_LOG_FILE, torn_file)
+                config.logger.warning(f"Moved inventory log with {len(torn)} unreadable line(s) to {torn_file}")
+            else:
+                os.remove(config.INVENTORY_LOG_FILE)
                 
             # Expert Suggestion: Auto-backup
             if config.AUTO_BACKUP_REGISTRY:
                 backup_file = config.INVENTORY_FILE + f".{time.strftime('%Y%m%d%H%M%S')}.bak"
-                with open(backup_file, "w") as f:
-                    json.dump(inventory, f, indent=2)
+                with open(backup_file, "wb") as f:
+                    f.write(jsonio.dumps(inventory))
                     
         finally:
             InventoryManager.release_lock()
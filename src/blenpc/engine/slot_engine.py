@@ -1,41 +1,91 @@
-import json
-import os
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
 
 # Expert Fix: Absolute imports for the package structure
 from .. import config
+from .inventory_manager import InventoryManager
 
 def get_aabb(obj) -> Dict[str, List[float]]:
     """Calculate Axis-Aligned Bounding Box for a Blender object."""
-    bbox_corners = [obj.matrix_world @ v for v in obj.bound_box]
-    
-    min_x = min(v[0] for v in bbox_corners)
-    min_y = min(v[1] for v in bbox_corners)
-    min_z = min(v[2] for v in bbox_corners)
-    
-    max_x = max(v[0] for v in bbox_corners)
-    max_y = max(v[1] for v in bbox_corners)
-    max_z = max(v[2] for v in bbox_corners)
+    # All 8 corners in one affine transform, then a min/max reduction per axis
+    matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+    corners = np.asarray(obj.bound_box, dtype=np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
     
     # Expert Fix: Rounding for consistent exports
     return {
-        "min": [round(min_x, config.EXPORT_PRECISION), round(min_y, config.EXPORT_PRECISION), round(min_z, config.EXPORT_PRECISION)],
-        "max": [round(max_x, config.EXPORT_PRECISION), round(max_y, config.EXPORT_PRECISION), round(max_z, config.EXPORT_PRECISION)]
+        "min": np.round(corners.min(axis=0), config.EXPORT_PRECISION).tolist(),
+        "max": np.round(corners.max(axis=0), config.EXPORT_PRECISION).tolist()
     }
 
+class SlotIndex:
+    """Spatial index over slot AABBs packed as (N, 6) rows of xmin, ymin, zmin, xmax, ymax, zmax.
+    
+    Candidates come from a cKDTree over slot centres when scipy is installed,
+    otherwise from one vectorized pass; both finish with an exact AABB test.
+    """
+    
+    def __init__(self, ids: Sequence[str], bounds: np.ndarray):
+        self.ids = list(ids)
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 6)
+        self.centers = (self.bounds[:, :3] + self.bounds[:, 3:]) * 0.5
+        half_extents = (self.bounds[:, 3:] - self.bounds[:, :3]) * 0.5
+        # Any slot overlapping a box lies within this distance of the box's reach
+        self._max_radius = float(np.linalg.norm(half_extents, axis=1).max(initial=0.0))
+        self._tree = cKDTree(self.centers) if cKDTree is not None and len(self.ids) else None
+    
+    @classmethod
+    def from_slots(cls, slots, pos_key: str = "pos_meters", size_key: str = "size_meters") -> "SlotIndex":
+        """Index slot dicts centred on pos, with a (width, height) size in the x/z plane."""
+        slots = list(slots)
+        centers = np.array([slot[pos_key] for slot in slots], dtype=np.float64).reshape(-1, 3)
+        sizes = np.array([slot[size_key] for slot in slots], dtype=np.float64).reshape(-1, 2)
+        half = np.zeros_like(centers)
+        half[:, 0] = sizes[:, 0] * 0.5
+        half[:, 2] = sizes[:, 1] * 0.5
+        return cls([slot["id"] for slot in slots], np.hstack((centers - half, centers + half)))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def _candidates(self, center: np.ndarray, radius: float) -> np.ndarray:
+        if self._tree is None:
+            return np.arange(len(self.ids))
+        return np.asarray(self._tree.query_ball_point(center, radius + self._max_radius), dtype=np.intp)
+    
+    def query_aabb(self, box_min: Sequence[float], box_max: Sequence[float]) -> List[str]:
+        """Ids of slots whose AABB overlaps [box_min, box_max], in index order."""
+        box_min = np.asarray(box_min, dtype=np.float64)
+        box_max = np.asarray(box_max, dtype=np.float64)
+        idx = self._candidates((box_min + box_max) * 0.5, float(np.linalg.norm(box_max - box_min)) * 0.5)
+        bounds = self.bounds[idx]
+        hit = np.all((bounds[:, :3] <= box_max) & (bounds[:, 3:] >= box_min), axis=1)
+        return [self.ids[i] for i in np.sort(idx[hit])]
+    
+    def query_point(self, point: Sequence[float]) -> List[str]:
+        """Ids of slots whose AABB contains point."""
+        return self.query_aabb(point, point)
+    
+    def nearest(self, point: Sequence[float]) -> Optional[Tuple[str, float]]:
+        """(id, distance) of the slot centre closest to point, or None when empty."""
+        if not self.ids:
+            return None
+        if self._tree is not None:
+            distance, i = self._tree.query(point)
+        else:
+            distances = np.linalg.norm(self.centers - np.asarray(point, dtype=np.float64), axis=1)
+            i = int(distances.argmin())
+            distance = distances[i]
+        return self.ids[int(i)], float(distance)
+
 def find_asset(tags: List[str]) -> Optional[Dict]:
     """Find an asset in the inventory that matches all provided tags."""
-    if not os.path.exists(config.INVENTORY_FILE):
-        return None
-        
-    with open(config.INVENTORY_FILE, "r") as f:
-        inventory = json.load(f)
-        
-    for asset_id, asset_data in inventory.get("assets", {}).items():
-        if all(tag in asset_data.get("tags", []) for tag in tags):
-            return asset_data
-            
-    return None
+    return InventoryManager.find_asset(tags)
 
 def place_on_slot(parent_obj, slot_data: Dict, asset_tags: List[str]):
     """Place a matching asset on a specific slot of a parent object."""
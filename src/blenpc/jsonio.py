@@ -0,0 +1,54 @@
+"""JSON encode/decode helpers that use orjson when it is installed."""
+
+import json
+import os
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact or indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str; raises ValueError on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# path -> ((st_mtime_ns, st_size), parsed document)
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_cached(path: str) -> Optional[Any]:
+    """Parse a JSON file, reusing the previous result while the file is unchanged.
+
+    Returns None when the file does not exist. The returned object is shared
+    between callers and must not be mutated.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _FILE_CACHE.pop(path, None)
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = loads(f.read())
+    _FILE_CACHE[path] = (key, data)
+    return data
@@ -5,10 +5,7 @@ from __future__ import annotations
 from typing import Dict, List, Optional, Tuple
 
 from .config import EPSILON
-from .datamodel import AdjacencyMap, Corridor, Rect, Room
-
-
-SIDES = ("north", "south", "east", "west")
+from .datamodel import SIDES, AdjacencyMap, Corridor, Rect, Room
 
 
 def _overlap_1d(a0: float, a1: float, b0: float, b1: float) -> float:
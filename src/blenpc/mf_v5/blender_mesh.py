@@ -2,138 +2,322 @@
 
 import bpy
 import bmesh
-from typing import List, Iterable, Optional
-from .datamodel import WallSegment, Rect
+import numpy as np
+from typing import Dict, List, Iterable, Optional, Union
+from .datamodel import WallSegment, WallSegmentArray, Rect
 from .slabs import Slab
 from .roof import RoofGeometry
-from .config import TEXTURE_TILE_SIZE
-
-def _add_box_with_uv(bm: bmesh.types.BMesh, x1, y1, z1, x2, y2, z2, uv_layer):
-    """Helper to add a box with world-space UV projection."""
-    v = []
-    for z in [z1, z2]:
-        v.append(bm.verts.new((x1, y1, z)))
-        v.append(bm.verts.new((x2, y1, z)))
-        v.append(bm.verts.new((x2, y2, z)))
-        v.append(bm.verts.new((x1, y2, z)))
-    
-    faces = []
-    try:
-        faces.append(bm.faces.new(v[0:4])) # bottom
-        faces.append(bm.faces.new(v[4:8])) # top
-        faces.append(bm.faces.new((v[0], v[1], v[5], v[4]))) # front
-        faces.append(bm.faces.new((v[1], v[2], v[6], v[5]))) # right
-        faces.append(bm.faces.new((v[2], v[3], v[7], v[6]))) # back
-        faces.append(bm.faces.new((v[3], v[0], v[4], v[7]))) # left
-    except ValueError:
-        pass
-    
-    for f in faces:
-        for loop in f.loops:
-            co = loop.vert.co
-            if abs(f.normal.y) > 0.5:
-                loop[uv_layer].uv = (co.x / TEXTURE_TILE_SIZE, co.z / TEXTURE_TILE_SIZE)
-            else:
-                loop[uv_layer].uv = (co.y / TEXTURE_TILE_SIZE, co.z / TEXTURE_TILE_SIZE)
-
-def create_wall_mesh(segments: Iterable[WallSegment], name: str = "Walls", material: Optional[bpy.types.Material] = None):
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    if material: obj.data.materials.append(material)
-    
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    
-    for s in segments:
-        half_t = s.thickness / 2
-        dx, dy = s.x2 - s.x1, s.y2 - s.y1
-        length = (dx**2 + dy**2)**0.5
-        if length < 1e-4: continue
-        ux, uy = dx / length, dy / length
-        nx, ny = -uy, ux
-        
-        window = getattr(s, 'window_opening', None)
-        if window:
-            _add_box_with_uv(bm, s.x1 - nx * half_t, s.y1 - ny * half_t, 0, s.x2 + nx * half_t, s.y2 + ny * half_t, window.sill_height, uv_layer)
-            _add_box_with_uv(bm, s.x1 - nx * half_t, s.y1 - ny * half_t, window.sill_height + window.height, s.x2 + nx * half_t, s.y2 + ny * half_t, s.height, uv_layer)
-        else:
-            _add_box_with_uv(bm, s.x1 - nx * half_t, s.y1 - ny * half_t, 0, s.x2 + nx * half_t, s.y2 + ny * half_t, s.height, uv_layer)
+from .config import EPSILON, MERGE_DISTANCE, TEXTURE_TILE_SIZE
+from .jit import njit
 
-    bm.to_mesh(mesh)
-    bm.free()
-    return obj
+# Box corners as column picks from an (x1, y1, z1, x2, y2, z2) row:
+# bottom ring (z1) then top ring (z2), same order the bmesh boxes used.
+_BOX_X = np.array([0, 3, 3, 0, 0, 3, 3, 0])
+_BOX_Y = np.array([1, 1, 4, 4, 1, 1, 4, 4])
+_BOX_Z = np.array([2, 2, 2, 2, 5, 5, 5, 5])
 
-def create_slab_mesh(slabs: Iterable[Slab], name: str = "Slabs", material: Optional[bpy.types.Material] = None):
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    if material: obj.data.materials.append(material)
-        
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    
+# bottom, top, front, right, back, left; wound counter-clockwise seen from
+# outside so normals point out without a recalc pass
+_BOX_QUADS = np.array([
+    (3, 2, 1, 0),
+    (4, 5, 6, 7),
+    (0, 1, 5, 4),
+    (1, 2, 6, 5),
+    (2, 3, 7, 6),
+    (3, 0, 4, 7),
+], dtype=np.int32)
+
+# Faces whose normal points along Y get an XZ projection, the rest YZ.
+_BOX_UV_USES_X = np.array([False, False, True, False, True, False])
+
+def _quantize(co: np.ndarray, merge_distance: float) -> np.ndarray:
+    return np.round(co / merge_distance).astype(np.int64)
+
+def _weld(verts: np.ndarray, quads: np.ndarray, merge_distance: float = MERGE_DISTANCE):
+    """Collapse coincident corners into one vertex and remap the index buffer."""
+    _, first, remap = np.unique(_quantize(verts, merge_distance), axis=0, return_index=True, return_inverse=True)
+    return verts[first], remap.reshape(-1).astype(np.int32)[quads]
+
+# Storage types of the mesh properties we bulk-copy (DNA_meshdata_types.h).
+# foreach_set/get only memcpy when the buffer matches them exactly.
+_DNA_DTYPES = {
+    "vector": np.float32,
+    "co": np.float32,
+    "uv": np.float32,
+    "vertex_index": np.int32,
+    "loop_start": np.int32,
+}
+
+def _blit(data, key: str, arr: np.ndarray):
+    """foreach_set a flat, contiguous buffer of the property's storage type."""
+    data.foreach_set(key, np.ascontiguousarray(arr, dtype=_DNA_DTYPES[key]).ravel())
+
+def _gather(data, key: str, count: int, width: int = 1) -> np.ndarray:
+    """foreach_get a property into a new (count, width) buffer of its storage type."""
+    buf = np.empty(count * width, dtype=_DNA_DTYPES[key])
+    data.foreach_get(key, buf)
+    return buf.reshape(count, width)
+
+def _write_polygons(mesh: bpy.types.Mesh, verts: np.ndarray, loops: np.ndarray, loop_starts: np.ndarray, uvs: np.ndarray):
+    """Blit packed vertex/loop/polygon/UV buffers straight into mesh storage."""
+    mesh.vertices.add(len(verts))
+    _blit(mesh.attributes["position"].data, "vector", verts)
+    mesh.loops.add(len(loops))
+    _blit(mesh.loops, "vertex_index", loops)
+    mesh.polygons.add(len(loop_starts))
+    _blit(mesh.polygons, "loop_start", loop_starts)
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    _blit(uv_layer.data, "uv", uvs)
+    mesh.update(calc_edges=True)
+
+def _box_buffers(boxes: np.ndarray):
+    """Expand (N, 6) box extents into float32 verts, int32 quads and per-loop UVs."""
+    # Corner order must be min then max or the box comes out mirrored (inside out)
+    boxes = np.concatenate((np.minimum(boxes[:, :3], boxes[:, 3:]), np.maximum(boxes[:, :3], boxes[:, 3:])), axis=1)
+    # Flat boxes would weld into duplicate or degenerate faces
+    boxes = boxes[np.all(np.abs(boxes[:, 3:] - boxes[:, :3]) > MERGE_DISTANCE, axis=1)]
+    n = len(boxes)
+    verts = np.stack((boxes[:, _BOX_X], boxes[:, _BOX_Y], boxes[:, _BOX_Z]), axis=-1).reshape(n * 8, 3)
+    quads = (_BOX_QUADS[None, :, :] + (np.arange(n, dtype=np.int32) * 8)[:, None, None]).reshape(n * 6, 4)
+    co = verts[quads]
+    u = np.where(np.tile(_BOX_UV_USES_X, n)[:, None], co[..., 0], co[..., 1])
+    uvs = np.stack((u, co[..., 2]), axis=-1) / TEXTURE_TILE_SIZE
+    return verts.astype(np.float32), quads, uvs.astype(np.float32)
+
+# No fastmath: reordered float ops could move corners across the weld
+# quantization, so the JIT and plain paths must produce identical vertices
+@njit(cache=True)
+def _compute_wall_boxes(x1, y1, x2, y2, thickness, z0, z1):
+    """Offset each centreline by half its thickness into (x1, y1, z1, x2, y2, z2) rows."""
+    dx = x2 - x1
+    dy = y2 - y1
+    scale = thickness / 2 / np.hypot(dx, dy)
+    off_x = -dy * scale
+    off_y = dx * scale
+    boxes = np.empty((len(x1), 6), dtype=np.float64)
+    boxes[:, 0] = x1 - off_x
+    boxes[:, 1] = y1 - off_y
+    boxes[:, 2] = z0
+    boxes[:, 3] = x2 + off_x
+    boxes[:, 4] = y2 + off_y
+    boxes[:, 5] = z1
+    return boxes
+
+def _wall_boxes(segments: Union[Iterable[WallSegment], WallSegmentArray], z_offset: float = 0.0) -> np.ndarray:
+    """One (x1, y1, z1, x2, y2, z2) row per wall box, offset to the floor height."""
+    walls = segments if isinstance(segments, WallSegmentArray) else WallSegmentArray.from_segments(segments)
+    walls = walls.take(np.hypot(walls.x2 - walls.x1, walls.y2 - walls.y1) >= EPSILON)
+
+    # Window segments are a sill box under the opening plus a lintel box above it
+    has_window = walls.window_opening != None  # noqa: E711 - elementwise on an object array
+    windows = walls.window_opening[has_window].tolist()
+    sill = walls.height.copy()
+    sill[has_window] = [w.sill_height for w in windows]
+    head = np.array([w.sill_height + w.height for w in windows], dtype=np.float64)
+
+    src = np.concatenate((np.arange(len(walls)), np.flatnonzero(has_window)))
+    z0 = np.concatenate((np.zeros(len(walls)), head)) + z_offset
+    z1 = np.concatenate((sill, walls.height[has_window])) + z_offset
+
+    return _compute_wall_boxes(walls.x1[src], walls.y1[src], walls.x2[src], walls.y2[src], walls.thickness[src], z0, z1)
+
+def _slab_boxes(slabs: Iterable[Slab]) -> np.ndarray:
+    boxes = []
     for s in slabs:
-        r = s.rect
-        if s.hole_rect:
-            # Create slab with hole using 4 boxes around the hole
-            h = s.hole_rect
-            # Left box
-            _add_box_with_uv(bm, r.min_x, r.min_y, s.z, h.min_x, r.max_y, s.z + s.thickness, uv_layer)
-            # Right box
-            _add_box_with_uv(bm, h.max_x, r.min_y, s.z, r.max_x, r.max_y, s.z + s.thickness, uv_layer)
-            # Top box (middle part)
-            _add_box_with_uv(bm, h.min_x, h.max_y, s.z, h.max_x, r.max_y, s.z + s.thickness, uv_layer)
-            # Bottom box (middle part)
-            _add_box_with_uv(bm, h.min_x, r.min_y, s.z, h.max_x, h.min_y, s.z + s.thickness, uv_layer)
+        r, z0, z1 = s.rect, s.z, s.z + s.thickness
+        h = s.hole_rect
+        if h:
+            # Slab with hole: left, right, top and bottom boxes around it
+            boxes.append((r.min_x, r.min_y, z0, h.min_x, r.max_y, z1))
+            boxes.append((h.max_x, r.min_y, z0, r.max_x, r.max_y, z1))
+            boxes.append((h.min_x, h.max_y, z0, h.max_x, r.max_y, z1))
+            boxes.append((h.min_x, r.min_y, z0, h.max_x, h.min_y, z1))
         else:
-            _add_box_with_uv(bm, r.min_x, r.min_y, s.z, r.max_x, r.max_y, s.z + s.thickness, uv_layer)
-        
-    bm.to_mesh(mesh)
-    bm.free()
-    return obj
+            boxes.append((r.min_x, r.min_y, z0, r.max_x, r.max_y, z1))
+    return np.array(boxes, dtype=np.float64).reshape(-1, 6)
+
+def _roof_buffers(roof_geo: RoofGeometry):
+    """Weld roof corners into verts, loops, face sizes and per-loop UVs."""
+    co = roof_geo.vertex_buffer
+    offsets = roof_geo.face_offsets.tolist()
+
+    # A roof has a handful of corners: a dict dedupe beats np.unique here
+    slots: Dict[tuple, int] = {}
+    first: List[int] = []
+    remap: List[int] = []
+    for i, key in enumerate(map(tuple, _quantize(co, MERGE_DISTANCE).tolist())):
+        slot = slots.get(key)
+        if slot is None:
+            slot = slots[key] = len(first)
+            first.append(i)
+        remap.append(slot)
+
+    # Skip faces that repeat a corner or an earlier face, as bmesh would
+    loops: List[int] = []
+    sizes: List[int] = []
+    keep: List[int] = []
+    seen = set()
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        face = remap[start:end]
+        key = frozenset(face)
+        if len(key) == end - start and key not in seen:
+            seen.add(key)
+            loops.extend(face)
+            sizes.append(end - start)
+            keep.extend(range(start, end))
+    return (
+        co[first],
+        np.array(loops, dtype=np.int32),
+        np.array(sizes, dtype=np.int32),
+        co[keep, :2] / TEXTURE_TILE_SIZE,
+    )
+
+class MeshBuilder:
+    """Collects wall, slab and roof buffers and writes them out as one mesh.
+
+    Parts are kept as packed NumPy arrays until build(), which welds the
+    seams between them in the same pass as the corners within each part.
+    """
+
+    def __init__(self, merge_distance: float = MERGE_DISTANCE):
+        self.merge_distance = merge_distance
+        self._boxes: List[np.ndarray] = []
+        self._polygons: list = []
+
+    def add_wall_segments(self, segments: Union[Iterable[WallSegment], WallSegmentArray], z_offset: float = 0.0) -> "MeshBuilder":
+        self._boxes.append(_wall_boxes(segments, z_offset))
+        return self
+
+    def add_slabs(self, slabs: Iterable[Slab]) -> "MeshBuilder":
+        self._boxes.append(_slab_boxes(slabs))
+        return self
+
+    def add_roof(self, roof_geo: RoofGeometry) -> "MeshBuilder":
+        self._polygons.append(_roof_buffers(roof_geo))
+        return self
+
+    def build(self, name: str, material: Optional[bpy.types.Material] = None):
+        """Write everything added so far into a new object linked to the scene."""
+        mesh = bpy.data.meshes.new(name)
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        if material: obj.data.materials.append(material)
+
+        parts = list(self._polygons)
+        if self._boxes:
+            verts, quads, uvs = _box_buffers(np.concatenate(self._boxes))
+            parts.append((verts, quads.ravel(), np.full(len(quads), 4, dtype=np.int32), uvs.reshape(-1, 2)))
+        parts = [part for part in parts if len(part[2])]
+        if not parts:
+            return obj
+
+        base = np.cumsum([0] + [len(part[0]) for part in parts[:-1]])
+        verts = np.concatenate([part[0] for part in parts]).astype(np.float32)
+        loops = np.concatenate([part[1] + offset for part, offset in zip(parts, base)])
+        sizes = np.concatenate([part[2] for part in parts])
+        uvs = np.concatenate([part[3] for part in parts]).astype(np.float32)
+
+        verts, loops = _weld(verts, loops, self.merge_distance)
+        loop_starts = (np.cumsum(sizes) - sizes).astype(np.int32)
+        _write_polygons(mesh, verts, loops, loop_starts, uvs)
+        return obj
+
+    def finalize(self, extra_objects: Iterable[bpy.types.Object] = (), recalc_normals: bool = False):
+        """Build the combined mesh and run the final cleanup with any extra objects (stairs)."""
+        return final_merge_and_cleanup([self.build("Building_Parts"), *extra_objects], self.merge_distance, recalc_normals)
+
+def create_wall_mesh(segments: Union[Iterable[WallSegment], WallSegmentArray], name: str = "Walls", material: Optional[bpy.types.Material] = None):
+    return MeshBuilder().add_wall_segments(segments).build(name, material)
+
+def create_slab_mesh(slabs: Iterable[Slab], name: str = "Slabs", material: Optional[bpy.types.Material] = None):
+    return MeshBuilder().add_slabs(slabs).build(name, material)
 
 def create_roof_mesh(roof_geo: RoofGeometry, name: str = "Roof", material: Optional[bpy.types.Material] = None):
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.scene.collection.objects.link(obj)
-    if material: obj.data.materials.append(material)
-    
-    bm = bmesh.new()
-    uv_layer = bm.loops.layers.uv.new("UVMap")
-    for face in roof_geo.faces:
-        verts = [bm.verts.new(v) for v in face.vertices]
-        try:
-            f = bm.faces.new(verts)
-            for loop in f.loops:
-                co = loop.vert.co
-                loop[uv_layer].uv = (co.x / TEXTURE_TILE_SIZE, co.y / TEXTURE_TILE_SIZE)
-        except ValueError: pass
-    bm.to_mesh(mesh)
-    bm.free()
-    return obj
+    return MeshBuilder().add_roof(roof_geo).build(name, material)
+
+def _weld_seams(bm: bmesh.types.BMesh, co: np.ndarray, merge_distance: float):
+    """Weld verts shared between parts that were built as separate meshes.
+
+    Every part is welded on construction, so only seam verts are left and a
+    quantized lookup stands in for the remove_doubles kd-tree pass. ``co``
+    holds the (V, 3) positions of ``bm.verts`` in order.
+    """
+    _, first, remap = np.unique(_quantize(co, merge_distance), axis=0, return_index=True, return_inverse=True)
+    target = first[remap.reshape(-1)]
+    dupes = np.flatnonzero(target != np.arange(len(target)))
+    if not len(dupes):
+        return
+    bm.verts.ensure_lookup_table()
+    verts = bm.verts
+    bmesh.ops.weld_verts(bm, targetmap={verts[i]: verts[j] for i, j in zip(dupes.tolist(), target[dupes].tolist())})
+
+def find_internal_faces(bm: bmesh.types.BMesh) -> List[bmesh.types.BMFace]:
+    """Faces whose every edge is shared by more than two faces."""
+    bm.edges.index_update()
+    edge_faces = np.fromiter((len(e.link_faces) for e in bm.edges), dtype=np.int32, count=len(bm.edges))
+    if not len(edge_faces) or edge_faces.max() <= 2:
+        return []
+    faces = list(bm.faces)
+    sides = np.fromiter((len(f.edges) for f in faces), dtype=np.int32, count=len(faces))
+    face_edges = np.fromiter((e.index for f in faces for e in f.edges), dtype=np.int32, count=int(sides.sum()))
+    starts = np.concatenate(([0], np.cumsum(sides)[:-1]))
+    internal = np.logical_and.reduceat(edge_faces[face_edges] > 2, starts)
+    return [faces[i] for i in np.flatnonzero(internal).tolist()]
 
-def final_merge_and_cleanup(objects: List[bpy.types.Object], merge_distance: float = 0.0005):
+def final_merge_and_cleanup(objects: List[bpy.types.Object], merge_distance: float = MERGE_DISTANCE, recalc_normals: bool = False):
+    """Merge part objects into one cleaned "Building_Final" object.
+
+    Parts are appended into a single bmesh through the data API rather than
+    bpy.ops.object.join, so no selection changes or depsgraph updates happen.
+    Material slots are merged as join does: each distinct material gets one
+    slot and face material indices are remapped. The source objects are
+    removed afterwards.
+    """
     if not objects: return None
-    bpy.ops.object.select_all(action='DESELECT')
     valid_objs = [o for o in objects if o.type == 'MESH']
     if not valid_objs: return None
-    for obj in valid_objs: obj.select_set(True)
-    bpy.context.view_layer.objects.active = valid_objs[0]
-        # Ensure the object is in the scene collection before joining
-        if valid_objs[0].name not in bpy.context.scene.collection.objects:
-            bpy.context.scene.collection.objects.link(valid_objs[0])
-    bpy.ops.object.join()
-    merged_obj = bpy.context.active_object
-    merged_obj.name = "Building_Final"
+
     bm = bmesh.new()
-    bm.from_mesh(merged_obj.data)
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
-    bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-    internal_faces = [f for f in bm.faces if all(len(e.link_faces) > 2 for e in f.edges)]
+    positions = []
+    materials = []
+    for o in valid_objs:
+        # matrix_basis reflects location edits without a depsgraph update
+        matrix = np.array(o.matrix_basis, dtype=np.float32)
+        co = _gather(o.data.vertices, "co", len(o.data.vertices), 3)
+        positions.append(co @ matrix[:3, :3].T + matrix[:3, 3])
+        remap = []
+        for mat in o.data.materials:
+            if mat not in materials: materials.append(mat)
+            remap.append(materials.index(mat))
+        start = len(bm.verts)
+        face_start = len(bm.faces)
+        bm.from_mesh(o.data)
+        if remap != list(range(len(remap))):
+            bm.faces.ensure_lookup_table()
+            for f in bm.faces[face_start:]:
+                f.material_index = remap[min(f.material_index, len(remap) - 1)]
+        if not np.allclose(matrix, np.eye(4)):
+            bm.verts.ensure_lookup_table()
+            bmesh.ops.transform(bm, matrix=o.matrix_basis, verts=bm.verts[start:])
+
+    _weld_seams(bm, np.concatenate(positions), merge_distance)
+    internal_faces = find_internal_faces(bm)
     if internal_faces: bmesh.ops.delete(bm, geom=internal_faces, context='FACES')
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-    bm.to_mesh(merged_obj.data)
+    if recalc_normals:
+        # Every generator winds its faces outward; only needed for foreign input
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+
+    merged_mesh = bpy.data.meshes.new("Building_Final")
+    bm.to_mesh(merged_mesh)
     bm.free()
+    for mat in materials:
+        merged_mesh.materials.append(mat)
+    merged_obj = bpy.data.objects.new("Building_Final", merged_mesh)
+    bpy.context.scene.collection.objects.link(merged_obj)
+
+    for o in valid_objs:
+        mesh = o.data
+        bpy.data.objects.remove(o, do_unlink=True)
+        if not mesh.users:
+            bpy.data.meshes.remove(mesh)
     return merged_obj
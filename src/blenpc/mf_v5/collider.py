@@ -3,6 +3,8 @@
 import bpy
 import bmesh
 
+from .blender_mesh import find_internal_faces
+
 def create_simplified_collider(building_obj: bpy.types.Object, name: str = "Building_Collider") -> bpy.types.Object:
     """
     Create a simplified collider object from the building mesh.
@@ -24,8 +26,7 @@ def create_simplified_collider(building_obj: bpy.types.Object, name: str = "Buil
     bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.1)
     
     # 2. Delete internal faces (already done in building mesh, but let's be sure)
-    bm.edges.ensure_lookup_table()
-    internal_faces = [f for f in bm.faces if all(len(e.link_faces) > 2 for e in f.edges)]
+    internal_faces = find_internal_faces(bm)
     if internal_faces:
         bmesh.ops.delete(bm, geom=internal_faces, context='FACES')
         
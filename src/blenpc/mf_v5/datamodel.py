@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .windows import WindowOpening
+
+
+SIDES = ("north", "south", "east", "west")
+# Coordinate index a wall on each side runs along (0 = X, 1 = Y)
+SIDE_AXIS = {"north": 0, "south": 0, "east": 1, "west": 1}
+_SIDE_CODES = {side: code for code, side in enumerate(SIDES)}
 
 
 class Axis(str, Enum):
@@ -19,12 +30,20 @@ class RoofType(str, Enum):
     HIP = "hip"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     min_x: float
     min_y: float
     max_x: float
     max_y: float
+    # (min_x, min_y, max_x, max_y) as a read-only float64 array for vectorized
+    # callers, built once per Rect
+    bounds: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        bounds = np.array((self.min_x, self.min_y, self.max_x, self.max_y), dtype=np.float64)
+        bounds.flags.writeable = False
+        object.__setattr__(self, "bounds", bounds)
 
     def width(self) -> float:
         return self.max_x - self.min_x
@@ -33,21 +52,21 @@ class Rect:
         return self.max_y - self.min_y
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Room:
     rect: Rect
     floor_index: int
     id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Corridor:
     rect: Rect
     floor_index: int
     orientation: Axis = Axis.Y
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildingSpec:
     width: float
     depth: float
@@ -56,7 +75,7 @@ class BuildingSpec:
     roof_type: RoofType = RoofType.HIP
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WallSegment:
     room_id: int
     side: str
@@ -66,9 +85,79 @@ class WallSegment:
     y2: float
     height: float
     thickness: float
-
-
-@dataclass(frozen=True)
+    # Set on the middle piece of a window cut; the mesh builder leaves the gap
+    window_opening: Optional[WindowOpening] = None
+
+    def __post_init__(self):
+        # Canonical endpoint order (x1 <= x2, y1 <= y2) so splitters need no sorting
+        if self.x1 > self.x2:
+            x1, x2 = self.x2, self.x1
+            object.__setattr__(self, "x1", x1)
+            object.__setattr__(self, "x2", x2)
+        if self.y1 > self.y2:
+            y1, y2 = self.y2, self.y1
+            object.__setattr__(self, "y1", y1)
+            object.__setattr__(self, "y2", y2)
+
+
+@dataclass(frozen=True, slots=True)
+class WallSegmentArray:
+    """Structure-of-arrays batch of wall segments for the carving and mesh kernels.
+
+    ``side`` holds indices into SIDES and ``window_opening`` is an object array
+    that is None for solid segments. Rows keep WallSegment's x1 <= x2, y1 <= y2
+    endpoint order.
+    """
+    room_id: np.ndarray
+    side: np.ndarray
+    x1: np.ndarray
+    y1: np.ndarray
+    x2: np.ndarray
+    y2: np.ndarray
+    height: np.ndarray
+    thickness: np.ndarray
+    window_opening: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.room_id)
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[WallSegment]) -> WallSegmentArray:
+        segments = list(segments)
+        coords = np.array(
+            [(s.x1, s.y1, s.x2, s.y2, s.height, s.thickness) for s in segments],
+            dtype=np.float64,
+        ).reshape(-1, 6)
+        windows = np.empty(len(segments), dtype=object)
+        windows[:] = [s.window_opening for s in segments]
+        return cls(
+            room_id=np.array([s.room_id for s in segments], dtype=np.int64),
+            side=np.array([_SIDE_CODES[s.side] for s in segments], dtype=np.uint8),
+            x1=coords[:, 0],
+            y1=coords[:, 1],
+            x2=coords[:, 2],
+            y2=coords[:, 3],
+            height=coords[:, 4],
+            thickness=coords[:, 5],
+            window_opening=windows,
+        )
+
+    def take(self, index) -> WallSegmentArray:
+        """Gather rows by index array or mask into a new batch."""
+        return WallSegmentArray(*(getattr(self, f.name)[index] for f in fields(self)))
+
+    def to_segments(self) -> List[WallSegment]:
+        return [
+            WallSegment(room_id, SIDES[side], x1, y1, x2, y2, height, thickness, window)
+            for room_id, side, x1, y1, x2, y2, height, thickness, window in zip(
+                self.room_id.tolist(), self.side.tolist(),
+                self.x1.tolist(), self.y1.tolist(), self.x2.tolist(), self.y2.tolist(),
+                self.height.tolist(), self.thickness.tolist(), self.window_opening.tolist(),
+            )
+        ]
+
+
+@dataclass(frozen=True, slots=True)
 class DoorOpening:
     room_id: int
     side: str
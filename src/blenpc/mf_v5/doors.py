@@ -2,80 +2,137 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, DefaultDict
+from typing import Dict, Iterable, List, DefaultDict, Tuple
 from collections import defaultdict
+from dataclasses import replace
 
-from .config import DOOR_HEIGHT, DOOR_WIDTH, EPSILON
-from .datamodel import DoorOpening, WallSegment
-
-
-def _split_horizontal(seg: WallSegment, cx: float, door_width: float) -> List[WallSegment]:
-    left_end = cx - door_width / 2
-    right_start = cx + door_width / 2
-    x_min, x_max = sorted((seg.x1, seg.x2))
-
-    pieces: List[WallSegment] = []
-    if left_end - x_min > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, x_min, seg.y1, left_end, seg.y2, seg.height, seg.thickness))
-    if x_max - right_start > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, right_start, seg.y1, x_max, seg.y2, seg.height, seg.thickness))
-    return pieces
+import numpy as np
 
+from .config import DOOR_HEIGHT, DOOR_WIDTH, EPSILON
+from .datamodel import SIDE_AXIS, SIDES, DoorOpening, WallSegment, WallSegmentArray
+from .jit import njit
+
+
+@njit(cache=True)
+def _split_segments(s_min, s_max, cut_start, cut_end, centers, half_widths):
+    """Cut door intervals out of each segment's [s_min, s_max] span.
+
+    Segment i is cut by centers/half_widths[cut_start[i]:cut_end[i]], applied
+    in order: each opening splits only the piece that strictly contains its
+    centre, so a door centred in an earlier door's gap is skipped even if it
+    overlaps a neighbouring piece. Returns (source, start, end) per surviving
+    piece; segments no opening splits come back once with NaN bounds, meaning
+    untouched.
+    """
+    n = len(s_min)
+    cap = n + int(np.sum(cut_end - cut_start))
+    source = np.empty(cap, dtype=np.int64)
+    start = np.empty(cap, dtype=np.float64)
+    end = np.empty(cap, dtype=np.float64)
+    m = 0
+    for i in range(n):
+        k0 = cut_start[i]
+        # Each split adds at most one piece
+        size = cut_end[i] - k0 + 1
+        lo = np.empty(size, dtype=np.float64)
+        hi = np.empty(size, dtype=np.float64)
+        next_lo = np.empty(size, dtype=np.float64)
+        next_hi = np.empty(size, dtype=np.float64)
+        lo[0] = s_min[i]
+        hi[0] = s_max[i]
+        count = 1
+        split = False
+        for k in range(k0, cut_end[i]):
+            c = centers[k]
+            left_end = c - half_widths[k]
+            right_start = c + half_widths[k]
+            next_count = 0
+            for j in range(count):
+                if c > lo[j] + EPSILON and c < hi[j] - EPSILON:
+                    split = True
+                    if left_end - lo[j] > EPSILON:
+                        next_lo[next_count] = lo[j]
+                        next_hi[next_count] = left_end
+                        next_count += 1
+                    if hi[j] - right_start > EPSILON:
+                        next_lo[next_count] = right_start
+                        next_hi[next_count] = hi[j]
+                        next_count += 1
+                else:
+                    next_lo[next_count] = lo[j]
+                    next_hi[next_count] = hi[j]
+                    next_count += 1
+            lo, next_lo = next_lo, lo
+            hi, next_hi = next_hi, hi
+            count = next_count
+
+        if not split:
+            source[m] = i
+            start[m] = np.nan
+            end[m] = np.nan
+            m += 1
+            continue
+        for j in range(count):
+            source[m] = i
+            start[m] = lo[j]
+            end[m] = hi[j]
+            m += 1
+    return source[:m], start[:m], end[:m]
+
+
+def _pack_openings(openings: Iterable[DoorOpening]):
+    """Group openings by (room_id, side) into contiguous runs of centres along
+    the wall axis and half widths; returns ({key: (start, end)}, centers, half_widths)."""
+    openings_by_room_side: DefaultDict[tuple, List[DoorOpening]] = defaultdict(list)
+    for d in openings:
+        openings_by_room_side[(d.room_id, d.side)].append(d)
 
-def _split_vertical(seg: WallSegment, cy: float, door_width: float) -> List[WallSegment]:
-    bottom_end = cy - door_width / 2
-    top_start = cy + door_width / 2
-    y_min, y_max = sorted((seg.y1, seg.y2))
-
-    pieces: List[WallSegment] = []
-    if bottom_end - y_min > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, seg.x1, y_min, seg.x2, bottom_end, seg.height, seg.thickness))
-    if y_max - top_start > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, seg.x1, top_start, seg.x2, y_max, seg.height, seg.thickness))
-    return pieces
+    runs: Dict[tuple, Tuple[int, int]] = {}
+    centers: List[float] = []
+    half_widths: List[float] = []
+    for (room_id, side), group in openings_by_room_side.items():
+        axis = SIDE_AXIS[side]
+        runs[(room_id, side)] = (len(centers), len(centers) + len(group))
+        centers.extend(d.center[axis] for d in group)
+        half_widths.extend(d.width / 2 for d in group)
+    return runs, np.array(centers, dtype=np.float64), np.array(half_widths, dtype=np.float64)
+
+
+def carve_door_array(walls: WallSegmentArray, openings: Iterable[DoorOpening]) -> WallSegmentArray:
+    """Carve doors out of a segment batch, returning the pieces as a new batch."""
+    runs, centers, half_widths = _pack_openings(openings)
+    # SIDES puts north/south first: those walls run along X
+    horizontal = walls.side < 2
+    s_min = np.where(horizontal, walls.x1, walls.y1)
+    s_max = np.where(horizontal, walls.x2, walls.y2)
+
+    no_cuts = (0, 0)
+    cut_runs = np.array(
+        [runs.get((room_id, SIDES[side]), no_cuts) for room_id, side in zip(walls.room_id.tolist(), walls.side.tolist())],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    source, start, end = _split_segments(s_min, s_max, cut_runs[:, 0], cut_runs[:, 1], centers, half_widths)
+
+    # Untouched rows keep NaN bounds and their original coordinates
+    out = walls.take(source)
+    cut = ~np.isnan(start)
+    along_x = cut & horizontal[source]
+    along_y = cut & ~horizontal[source]
+    x1 = np.where(along_x, start, out.x1)
+    x2 = np.where(along_x, end, out.x2)
+    y1 = np.where(along_y, start, out.y1)
+    y2 = np.where(along_y, end, out.y2)
+    return replace(out, x1=x1, y1=y1, x2=x2, y2=y2)
 
 
 def carve_doors(
     wall_segments: Dict[int, List[WallSegment]],
     openings: Iterable[DoorOpening],
 ) -> Dict[int, List[WallSegment]]:
-    # Group openings by (room_id, side)
-    openings_by_room_side: DefaultDict[tuple, List[DoorOpening]] = defaultdict(list)
-    for d in openings:
-        openings_by_room_side[(d.room_id, d.side)].append(d)
-        
-    carved: Dict[int, List[WallSegment]] = {}
-
-    for room_id, segments in wall_segments.items():
-        out: List[WallSegment] = []
-        for seg in segments:
-            room_openings = openings_by_room_side.get((room_id, seg.side), [])
-            if not room_openings:
-                out.append(seg)
-                continue
-
-            # Apply all openings to this segment
-            current_pieces = [seg]
-            for opening in room_openings:
-                next_pieces = []
-                for p in current_pieces:
-                    if seg.side in ("north", "south"):
-                        # Check if opening is within this piece
-                        p_min, p_max = sorted((p.x1, p.x2))
-                        if opening.center[0] > p_min + EPSILON and opening.center[0] < p_max - EPSILON:
-                            next_pieces.extend(_split_horizontal(p, opening.center[0], opening.width))
-                        else:
-                            next_pieces.append(p)
-                    else:
-                        p_min, p_max = sorted((p.y1, p.y2))
-                        if opening.center[1] > p_min + EPSILON and opening.center[1] < p_max - EPSILON:
-                            next_pieces.extend(_split_vertical(p, opening.center[1], opening.width))
-                        else:
-                            next_pieces.append(p)
-                current_pieces = next_pieces
-            out.extend(current_pieces)
-        carved[room_id] = out
-
+    walls = WallSegmentArray.from_segments(seg for segments in wall_segments.values() for seg in segments)
+    carved: Dict[int, List[WallSegment]] = {room_id: [] for room_id in wall_segments}
+    for seg in carve_door_array(walls, openings).to_segments():
+        carved.setdefault(seg.room_id, []).append(seg)
     return carved
 
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import time
 
+import numpy as np
+
 try:
     import bpy
-    from .blender_mesh import create_wall_mesh, create_slab_mesh, create_roof_mesh, final_merge_and_cleanup
-    from .export import export_to_glb
+    from .blender_mesh import MeshBuilder
+    from .export import export_objects, export_to_glb
     from .collider import create_simplified_collider
     from .stairs import build_stair_mesh
 except ImportError:
@@ -48,8 +50,9 @@ class GenerationOutput:
     floors: List[FloorOutput]
     roof_type: str
     cleanup: Dict[str, object]
-    export_manifest: str
+    export_manifest: Optional[str]
     glb_path: Optional[str] = None
+    exports: Dict[str, str] = field(default_factory=dict)
 
 
 def validate_building_spec(spec: BuildingSpec):
@@ -83,8 +86,19 @@ def validate_building_spec(spec: BuildingSpec):
     return True
 
 
-def generate(spec: BuildingSpec, output_dir: Path) -> GenerationOutput:
-    """Procedurally generate a building based on spec."""
+def generate(
+    spec: BuildingSpec,
+    output_dir: Path,
+    formats: Iterable[str] = ("glb",),
+    collider: bool = True,
+    manifest: bool = True,
+) -> GenerationOutput:
+    """Procedurally generate a building based on spec, exporting it in each of formats.
+
+    Parallel per-format runs share one output directory: only one of them
+    should write the collider, and the manifest is written once by the caller
+    after all of them finish (pass collider/manifest=False to the others).
+    """
     start_time = time.time()
     logger.info(f"Starting generation: {spec.width}x{spec.depth}, {spec.floors} floors (Seed: {spec.seed})")
     
@@ -95,7 +109,8 @@ def generate(spec: BuildingSpec, output_dir: Path) -> GenerationOutput:
     top_z = 0.0
     stairwell = None
 
-    # For Blender rendering
+    # For Blender rendering: walls, slabs and roof share one mesh, stairs stay separate objects
+    builder = MeshBuilder() if bpy else None
     blender_objects = []
 
     try:
@@ -132,19 +147,12 @@ def generate(spec: BuildingSpec, output_dir: Path) -> GenerationOutput:
             slabs = build_floor_ceiling_slabs(rooms, floor_idx, stairwell.rect if stairwell else None)
             
             if bpy:
-                wall_obj = create_wall_mesh(merged_walls, f"Walls_F{floor_idx}")
-                wall_obj.location.z = floor_z_offset
-                blender_objects.append(wall_obj)
-                
-                slab_obj = create_slab_mesh(slabs, f"Slabs_F{floor_idx}")
-                blender_objects.append(slab_obj)
+                builder.add_wall_segments(merged_walls, z_offset=floor_z_offset)
+                builder.add_slabs(slabs)
 
             if rooms:
-                min_x = min(r.rect.min_x for r in rooms)
-                min_y = min(r.rect.min_y for r in rooms)
-                max_x = max(r.rect.max_x for r in rooms)
-                max_y = max(r.rect.max_y for r in rooms)
-                top_footprint = (min_x, min_y, max_x, max_y)
+                room_bounds = np.stack([r.rect.bounds for r in rooms])
+                top_footprint = (*room_bounds[:, :2].min(axis=0).tolist(), *room_bounds[:, 2:].max(axis=0).tolist())
                 top_z = (floor_idx + 1) * STORY_HEIGHT
 
             floor_outputs.append(
@@ -167,35 +175,31 @@ def generate(spec: BuildingSpec, output_dir: Path) -> GenerationOutput:
             roof_rect = Rect(*top_footprint)
             roof_geo = build_roof(roof_rect, top_z, spec.roof_type)
             if bpy and roof_geo:
-                roof_obj = create_roof_mesh(roof_geo, "Roof")
-                blender_objects.append(roof_obj)
+                builder.add_roof(roof_geo)
 
         glb_path = None
-        if bpy and blender_objects:
-            logger.info(f"Merging {len(blender_objects)} objects and cleaning up...")
-            final_obj = final_merge_and_cleanup(blender_objects)
+        exports: Dict[str, str] = {}
+        if bpy:
+            logger.info(f"Building merged mesh with {len(blender_objects)} extra objects and cleaning up...")
+            final_obj = builder.finalize(blender_objects)
             if final_obj:
-                collider_obj = create_simplified_collider(final_obj, "Building_Collider")
                 settings = ExportSettings()
-                # Deselect all objects first
-                bpy.ops.object.select_all(action='DESELECT')
-                # Select the final building object
-                final_obj.select_set(True)
-                # Export the main building
-                building_glb_path = export_to_glb(final_obj, output_dir, "Building", settings)
-                if building_glb_path: glb_path = str(building_glb_path)
-                # Deselect all objects again
-                bpy.ops.object.select_all(action='DESELECT')
-                # Select the collider object
-                collider_obj.select_set(True)
-                # Export the collider
-                collider_glb_path = export_to_glb(collider_obj, output_dir, "Building-col", settings)
+                exports = {
+                    fmt: str(path)
+                    for fmt, path in export_objects([final_obj], output_dir, "Building", settings, formats).items()
+                }
+                glb_path = exports.get("glb")
+                if collider:
+                    # Godot picks up the collider from the -col suffixed glTF
+                    collider_obj = create_simplified_collider(final_obj, "Building_Collider")
+                    export_to_glb([collider_obj], output_dir, f"Building{settings.collider_suffix}", settings)
 
             else:
                 raise ExportError("Failed to create merged building object.")
 
-        settings = ExportSettings()
-        manifest_path = export_manifest(output_dir / "export_manifest.json", "Building", settings)
+        manifest_path = None
+        if manifest:
+            manifest_path = export_manifest(output_dir / "export_manifest.json", "Building", ExportSettings(), exports)
         duration = time.time() - start_time
         logger.info(f"Generation completed successfully in {duration:.3f}s")
 
@@ -203,8 +207,9 @@ def generate(spec: BuildingSpec, output_dir: Path) -> GenerationOutput:
             floors=floor_outputs,
             roof_type=spec.roof_type.value,
             cleanup=summarize_cleanup(default_merge_plan()),
-            export_manifest=str(manifest_path),
-            glb_path=glb_path
+            export_manifest=str(manifest_path) if manifest_path else None,
+            glb_path=glb_path,
+            exports=exports
         )
     except Exception as e:
         logger.error(f"Generation failed: {str(e)}")
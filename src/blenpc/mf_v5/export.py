@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import functools
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 try:
     import bpy
 except ImportError:
     bpy = None
 
+from blenpc import jsonio
+
+from .exceptions import ExportError
+
 @dataclass(frozen=True)
 class ExportSettings:
     format: str = "GLTF2"
@@ -22,41 +26,104 @@ class ExportSettings:
     collider_suffix: str = "-col"
     navmesh_collection: str = "MF_Navmesh"
 
-def export_manifest(output_path: Path, building_name: str, settings: ExportSettings) -> Path:
+@functools.cache
+def _settings_json(settings: ExportSettings) -> Dict[str, object]:
+    """Settings as a JSON-ready dict, built once per (frozen, hashable) settings value.
+
+    The dict is shared between calls, so callers must not mutate it.
+    """
+    return asdict(settings)
+
+def export_manifest(
+    output_path: Path,
+    building_name: str,
+    settings: ExportSettings,
+    exports: Optional[Dict[str, str]] = None,
+) -> Path:
+    """Write the manifest; exports maps each exported format to its file path."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     payload: Dict[str, object] = {
         "building": f"{building_name}.glb",
         "collider": f"{building_name}{settings.collider_suffix}.glb",
         "navmesh": f"{building_name}_navmesh.glb",
-        "settings": settings.__dict__,
+        "exports": {fmt: Path(path).name for fmt, path in (exports or {}).items()},
+        "settings": _settings_json(settings),
     }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    output_path.write_bytes(jsonio.dumps(payload, indent=True))
     return output_path
 
-def export_to_glb(obj: bpy.types.Object, output_dir: Path, filename: str, settings: ExportSettings = ExportSettings()):
-    """Actual GLB export using bpy.ops for Blender 4.3."""
+def _export_glb(filepath: Path, settings: ExportSettings, objs: List[bpy.types.Object]):
+    # In Blender 4.x, some export parameters might have changed, but gltf basic ones are stable
+    bpy.ops.export_scene.gltf(
+        filepath=str(filepath),
+        export_format='GLB',
+        use_selection=settings.selected_only,
+        export_yup=settings.y_up,
+        export_apply=settings.apply_modifiers,
+    )
+
+def _export_fbx(filepath: Path, settings: ExportSettings, objs: List[bpy.types.Object]):
+    bpy.ops.export_scene.fbx(
+        filepath=str(filepath),
+        use_selection=settings.selected_only,
+        use_mesh_modifiers=settings.apply_modifiers,
+        axis_up='Y' if settings.y_up else 'Z',
+    )
+
+def _export_obj(filepath: Path, settings: ExportSettings, objs: List[bpy.types.Object]):
+    bpy.ops.wm.obj_export(
+        filepath=str(filepath),
+        export_selected_objects=settings.selected_only,
+        apply_modifiers=settings.apply_modifiers,
+        up_axis='Y' if settings.y_up else 'Z',
+    )
+
+def _export_blend(filepath: Path, settings: ExportSettings, objs: List[bpy.types.Object]):
+    bpy.data.libraries.write(str(filepath), set(objs), fake_user=True)
+
+# One writer per entry in config.EXPORT_FORMATS_SUPPORTED; each exports the current selection
+_EXPORTERS = {
+    "glb": _export_glb,
+    "fbx": _export_fbx,
+    "obj": _export_obj,
+    "blend": _export_blend,
+}
+
+def export_objects(
+    objs: List[bpy.types.Object],
+    output_dir: Path,
+    filename: str,
+    settings: ExportSettings = ExportSettings(),
+    formats: Iterable[str] = ("glb",),
+) -> Dict[str, Path]:
+    """Select objs in one pass, then write <filename>.<format> once per format.
+
+    Returns the written path per format; formats whose export failed are left out.
+    """
     if bpy is None:
-        return None
-        
+        return {}
+    formats = list(formats)
+    unknown = [fmt for fmt in formats if fmt not in _EXPORTERS]
+    if unknown:
+        raise ExportError(f"Unsupported export format(s): {', '.join(unknown)}")
+
     output_dir.mkdir(parents=True, exist_ok=True)
-    
-    filepath = output_dir / f"{filename}.glb"
-    
-    # In Blender 4.x, some export parameters might have changed, but gltf basic ones are stable
-    try:
-        bpy.ops.export_scene.gltf(
-            filepath=str(filepath),
-            export_format='GLB',
-            use_selection=settings.selected_only,
-            export_yup=settings.y_up,
-            export_apply=settings.apply_modifiers,
-        )
-    except Exception as e:
-        print(f"Export failed: {e}")
-        return None
-    
-    # Selection handling is now done in engine.py before calling this function
-    # This function now exports a single object that is already selected
-    # The collider path logic should be handled by the caller as well
-    
-    return filepath
+
+    wanted = {o.name for o in objs}
+    for o in bpy.context.view_layer.objects:
+        o.select_set(o.name in wanted)
+
+    paths: Dict[str, Path] = {}
+    for fmt in formats:
+        filepath = output_dir / f"{filename}.{fmt}"
+        try:
+            _EXPORTERS[fmt](filepath, settings, objs)
+        except Exception as e:
+            print(f"Export failed ({fmt}): {e}")
+            continue
+        paths[fmt] = filepath
+    return paths
+
+def export_to_glb(objs: List[bpy.types.Object], output_dir: Path, filename: str, settings: ExportSettings = ExportSettings()):
+    """Actual GLB export using bpy.ops for Blender 4.3."""
+    return export_objects(objs, output_dir, filename, settings, ("glb",)).get("glb")
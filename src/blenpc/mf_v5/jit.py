@@ -0,0 +1,26 @@
+"""Optional Numba JIT for the numeric kernels.
+
+``njit`` compiles with numba when it is installed and otherwise hands the
+function back unchanged, so kernels must also run as plain NumPy/Python.
+Set ``BLENPC_DISABLE_NUMBA=1`` to force the plain path (no JIT warmup,
+line coverage for the kernel bodies).
+"""
+
+import os
+
+if os.environ.get("BLENPC_DISABLE_NUMBA", "") not in ("", "0"):
+    _numba_njit = None
+else:
+    try:
+        from numba import njit as _numba_njit
+    except ImportError:
+        _numba_njit = None
+
+
+def njit(*args, **kwargs):
+    """Drop-in for ``numba.njit``, usable bare or with options."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda fn: fn
@@ -12,7 +12,7 @@ from .config import DISSOLVE_ANGLE, MERGE_DISTANCE
 class MergePlan:
     merge_distance: float = MERGE_DISTANCE
     dissolve_angle: float = DISSOLVE_ANGLE
-    recalc_normals: bool = True
+    recalc_normals: bool = False
     remove_degenerate: bool = True
     delete_loose: bool = True
     mesh_validate: bool = True
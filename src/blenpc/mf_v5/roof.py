@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 from .config import ROOF_HEIGHT
 from .datamodel import Rect, RoofType
@@ -16,89 +18,67 @@ class RoofFace:
 
 @dataclass(frozen=True)
 class RoofGeometry:
+    """Roof faces packed back to back: face i owns vertex_buffer[face_offsets[i]:face_offsets[i + 1]]."""
     roof_type: RoofType
-    faces: List[RoofFace]
+    vertex_buffer: np.ndarray  # (L, 3) float32, one row per face corner
+    face_offsets: np.ndarray  # (F + 1,) int32
+
+    @property
+    def faces(self) -> List[RoofFace]:
+        co = self.vertex_buffer.tolist()
+        bounds = self.face_offsets.tolist()
+        return [RoofFace(tuple(map(tuple, co[start:end]))) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+# Base corners, counter-clockwise from the footprint minimum
+_BASE = ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0))
+
+
+def _topology(extra_points: Sequence[Tuple[float, float, float]], faces: Sequence[Tuple[int, ...]]):
+    """Precompute key points as footprint fractions plus a flat corner index and face offsets."""
+    points = np.array(_BASE + tuple(extra_points), dtype=np.float64)
+    corners = np.array([i for face in faces for i in face], dtype=np.intp)
+    offsets = np.cumsum([0] + [len(face) for face in faces]).astype(np.int32)
+    return points, corners, offsets
+
+
+# Faces are wound counter-clockwise seen from outside (outward normals)
+_ROOF_TOPOLOGY = {
+    # 4 slopes to the apex + bottom
+    RoofType.HIP: _topology(
+        [(0.5, 0.5, 1)],
+        [(0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4), (3, 2, 1, 0)],
+    ),
+    # Top + bottom
+    RoofType.FLAT: _topology(
+        [],
+        [(0, 1, 2, 3), (3, 2, 1, 0)],
+    ),
+    # Ridge along Y: 2 slopes, 2 gable ends, bottom
+    RoofType.GABLED: _topology(
+        [(0.5, 0, 1), (0.5, 1, 1)],
+        [(0, 4, 5, 3), (1, 2, 5, 4), (0, 1, 4), (3, 5, 2), (3, 2, 1, 0)],
+    ),
+    # High side at max_x: slope, 4 sides, bottom. The low (west) side has
+    # no height and is dropped when meshing.
+    RoofType.SHED: _topology(
+        [(1, 0, 1), (1, 1, 1)],
+        [(0, 4, 5, 3), (0, 1, 4), (1, 2, 5, 4), (2, 3, 5), (3, 0, 0, 3), (3, 2, 1, 0)],
+    ),
+}
 
 
 def build_roof(footprint: Rect, base_z: float, roof_type: RoofType) -> RoofGeometry:
-    min_x, min_y, max_x, max_y = footprint.min_x, footprint.min_y, footprint.max_x, footprint.max_y
-    
-    if roof_type == RoofType.HIP:
-        cx = (min_x + max_x) / 2
-        cy = (min_y + max_y) / 2
-        apex = (cx, cy, base_z + ROOF_HEIGHT)
-        corners = [
-            (min_x, min_y, base_z),
-            (max_x, min_y, base_z),
-            (max_x, max_y, base_z),
-            (min_x, max_y, base_z),
-        ]
-        faces = [
-            RoofFace((corners[0], corners[1], apex)),
-            RoofFace((corners[1], corners[2], apex)),
-            RoofFace((corners[2], corners[3], apex)),
-            RoofFace((corners[3], corners[0], apex)),
-            # Bottom face
-            RoofFace((corners[3], corners[2], corners[1], corners[0])),
-        ]
-        return RoofGeometry(roof_type, faces)
-
-    if roof_type == RoofType.FLAT:
-        faces = [
-            # Top face
-            RoofFace(((min_x, min_y, base_z), (max_x, min_y, base_z), (max_x, max_y, base_z), (min_x, max_y, base_z))),
-            # Bottom face
-            RoofFace(((min_x, max_y, base_z), (max_x, max_y, base_z), (max_x, min_y, base_z), (min_x, min_y, base_z))),
-        ]
-        return RoofGeometry(roof_type, faces)
-
-    if roof_type == RoofType.GABLED:
-        mid_x = (min_x + max_x) / 2
-        ridge_a = (mid_x, min_y, base_z + ROOF_HEIGHT)
-        ridge_b = (mid_x, max_y, base_z + ROOF_HEIGHT)
-        
-        c0 = (min_x, min_y, base_z)
-        c1 = (max_x, min_y, base_z)
-        c2 = (max_x, max_y, base_z)
-        c3 = (min_x, max_y, base_z)
-        
-        faces = [
-            # Main slopes
-            RoofFace((c0, ridge_a, ridge_b, c3)),
-            RoofFace((c1, c2, ridge_b, ridge_a)),
-            # Gable ends
-            RoofFace((c0, c1, ridge_a)),
-            RoofFace((c3, ridge_b, c2)),
-            # Bottom
-            RoofFace((c3, c2, c1, c0)),
-        ]
-        return RoofGeometry(roof_type, faces)
-
-    if roof_type == RoofType.SHED:
-        # High side at max_x
-        c0 = (min_x, min_y, base_z)
-        c1 = (max_x, min_y, base_z + ROOF_HEIGHT)
-        c2 = (max_x, max_y, base_z + ROOF_HEIGHT)
-        c3 = (min_x, max_y, base_z)
-        
-        # Bottom corners for solid
-        b0 = (min_x, min_y, base_z)
-        b1 = (max_x, min_y, base_z)
-        b2 = (max_x, max_y, base_z)
-        b3 = (min_x, max_y, base_z)
-        
-        faces = [
-            # Top slope
-            RoofFace((c0, c1, c2, c3)),
-            # Sides
-            RoofFace((b0, b1, c1, c0)),
-            RoofFace((b1, b2, c2, c1)),
-            RoofFace((b2, b3, c3, c2)),
-            RoofFace((b3, b0, c0, c3)),
-            # Bottom
-            RoofFace((b3, b2, b1, b0)),
-        ]
-        return RoofGeometry(roof_type, faces)
-
-    # Fallback to FLAT
-    return build_roof(footprint, base_z, RoofType.FLAT)
+    try:
+        roof_type = RoofType(roof_type)
+    except ValueError:
+        # Fallback to FLAT
+        roof_type = RoofType.FLAT
+    points, corners, offsets = _ROOF_TOPOLOGY[roof_type]
+
+    # All key points in one broadcast: footprint minimum + fraction * extent
+    bounds = footprint.bounds
+    origin = np.append(bounds[:2], base_z)
+    extent = np.append(bounds[2:] - bounds[:2], ROOF_HEIGHT)
+    coords = origin + points * extent
+    return RoofGeometry(roof_type, vertex_buffer=coords[corners].astype(np.float32), face_offsets=offsets)
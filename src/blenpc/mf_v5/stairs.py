@@ -84,7 +84,8 @@ def build_stair_mesh(stairwell: Stairwell, total_floors: int, name: str = "Stair
             
             try:
                 faces = [
-                    bm.faces.new(v[0:4]), bm.faces.new(v[4:8]),
+                    # Bottom wound downward, the rest outward
+                    bm.faces.new(v[3::-1]), bm.faces.new(v[4:8]),
                     bm.faces.new((v[0], v[1], v[5], v[4])),
                     bm.faces.new((v[1], v[2], v[6], v[5])),
                     bm.faces.new((v[2], v[3], v[7], v[6])),
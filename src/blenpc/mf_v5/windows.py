@@ -5,9 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Tuple, DefaultDict
 from collections import defaultdict
+from operator import attrgetter
 
 from .config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_SILL_HEIGHT, EPSILON
-from .datamodel import WallSegment, Room
+from .datamodel import SIDE_AXIS, WallSegment, Room
 
 
 @dataclass(frozen=True)
@@ -35,32 +36,40 @@ def generate_window_placements(rooms: Iterable[Room]) -> List[WindowOpening]:
     return openings
 
 
-def _split_horizontal(seg: WallSegment, cx: float, width: float) -> List[WallSegment]:
-    left_end = cx - width / 2
-    right_start = cx + width / 2
-    x_min, x_max = sorted((seg.x1, seg.x2))
+def _split_horizontal(p: WallSegment, opening: WindowOpening) -> List[WallSegment]:
+    left_end = opening.center[0] - opening.width / 2
+    right_start = opening.center[0] + opening.width / 2
 
     pieces: List[WallSegment] = []
-    if left_end - x_min > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, x_min, seg.y1, left_end, seg.y2, seg.height, seg.thickness))
-    if x_max - right_start > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, right_start, seg.y1, x_max, seg.y2, seg.height, seg.thickness))
+    if left_end - p.x1 > EPSILON:
+        pieces.append(WallSegment(p.room_id, p.side, p.x1, p.y1, left_end, p.y2, p.height, p.thickness))
+    # The middle piece (window area), tagged so blender_mesh.py leaves the opening
+    pieces.append(WallSegment(p.room_id, p.side, left_end, p.y1, right_start, p.y2, p.height, p.thickness, opening))
+    if p.x2 - right_start > EPSILON:
+        pieces.append(WallSegment(p.room_id, p.side, right_start, p.y1, p.x2, p.y2, p.height, p.thickness))
     return pieces
 
 
-def _split_vertical(seg: WallSegment, cy: float, width: float) -> List[WallSegment]:
-    bottom_end = cy - width / 2
-    top_start = cy + width / 2
-    y_min, y_max = sorted((seg.y1, seg.y2))
+def _split_vertical(p: WallSegment, opening: WindowOpening) -> List[WallSegment]:
+    bottom_end = opening.center[1] - opening.width / 2
+    top_start = opening.center[1] + opening.width / 2
 
     pieces: List[WallSegment] = []
-    if bottom_end - y_min > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, seg.x1, y_min, seg.x2, bottom_end, seg.height, seg.thickness))
-    if y_max - top_start > EPSILON:
-        pieces.append(WallSegment(seg.room_id, seg.side, seg.x1, top_start, seg.x2, y_max, seg.height, seg.thickness))
+    if bottom_end - p.y1 > EPSILON:
+        pieces.append(WallSegment(p.room_id, p.side, p.x1, p.y1, p.x2, bottom_end, p.height, p.thickness))
+    pieces.append(WallSegment(p.room_id, p.side, p.x1, bottom_end, p.x2, top_start, p.height, p.thickness, opening))
+    if p.y2 - top_start > EPSILON:
+        pieces.append(WallSegment(p.room_id, p.side, p.x1, top_start, p.x2, p.y2, p.height, p.thickness))
     return pieces
 
 
+# Per wall axis: the split function and the segment's span along that axis
+_SPLITS = (
+    (_split_horizontal, attrgetter("x1", "x2")),
+    (_split_vertical, attrgetter("y1", "y2")),
+)
+
+
 def carve_windows(
     wall_segments: Dict[int, List[WallSegment]],
     openings: Iterable[WindowOpening],
@@ -85,45 +94,16 @@ def carve_windows(
                 out.append(seg)
                 continue
 
+            axis = SIDE_AXIS[seg.side]
+            split, span = _SPLITS[axis]
             current_pieces = [seg]
             for opening in room_openings:
+                c = opening.center[axis]
                 next_pieces = []
                 for p in current_pieces:
-                    # Mark the piece that contains the window for special mesh handling
-                    is_horizontal = seg.side in ("north", "south")
-                    coord = opening.center[0] if is_horizontal else opening.center[1]
-                    p_min, p_max = sorted((p.x1, p.x2)) if is_horizontal else sorted((p.y1, p.y2))
-                    
-                    if coord > p_min + EPSILON and coord < p_max - EPSILON:
-                        # Split and keep track of the 'window' segment
-                        if is_horizontal:
-                            left_end = opening.center[0] - opening.width / 2
-                            right_start = opening.center[0] + opening.width / 2
-                            
-                            if left_end - p_min > EPSILON:
-                                next_pieces.append(WallSegment(p.room_id, p.side, p_min, p.y1, left_end, p.y2, p.height, p.thickness))
-                            
-                            # The middle piece (window area)
-                            win_seg = WallSegment(p.room_id, p.side, left_end, p.y1, right_start, p.y2, p.height, p.thickness)
-                            # Tag for blender_mesh.py
-                            win_seg.__dict__['window_opening'] = opening
-                            next_pieces.append(win_seg)
-                            
-                            if p_max - right_start > EPSILON:
-                                next_pieces.append(WallSegment(p.room_id, p.side, right_start, p.y1, p_max, p.y2, p.height, p.thickness))
-                        else:
-                            bottom_end = opening.center[1] - opening.width / 2
-                            top_start = opening.center[1] + opening.width / 2
-                            
-                            if bottom_end - p_min > EPSILON:
-                                next_pieces.append(WallSegment(p.room_id, p.side, p.x1, p_min, p.x2, bottom_end, p.height, p.thickness))
-                            
-                            win_seg = WallSegment(p.room_id, p.side, p.x1, bottom_end, p.x2, top_start, p.height, p.thickness)
-                            win_seg.__dict__['window_opening'] = opening
-                            next_pieces.append(win_seg)
-                            
-                            if p_max - top_start > EPSILON:
-                                next_pieces.append(WallSegment(p.room_id, p.side, p.x1, top_start, p.x2, p_max, p.height, p.thickness))
+                    p_min, p_max = span(p)
+                    if p_min + EPSILON < c < p_max - EPSILON:
+                        next_pieces.extend(split(p, opening))
                     else:
                         next_pieces.append(p)
                 current_pieces = next_pieces
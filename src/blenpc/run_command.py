@@ -1,9 +1,9 @@
 import sys
-import json
 import os
 import time
 import traceback
 from pathlib import Path
+from typing import Dict, List
 
 # Expert Fix: Add src/ to path so 'blenpc' can be imported
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,95 +17,133 @@ except ImportError:
     bpy = None
 
 # Expert Fix: Absolute imports from the package
-from blenpc import config
+from blenpc import config, jsonio
 from blenpc.atoms.wall import create_engineered_wall
 from blenpc.engine.inventory_manager import InventoryManager
 from blenpc.mf_v5.engine import generate as generate_building
 from blenpc.mf_v5.datamodel import BuildingSpec, RoofType
 
-def run():
-    input_file = None
-    output_file = None
+def execute(command_data: Dict) -> Dict:
+    """Run one command payload inside Blender and return its result."""
     try:
-        if '--' in sys.argv:
-            args = sys.argv[sys.argv.index('--') + 1:]
-            if len(args) >= 2:
-                input_file = args[0]
-                output_file = args[1]
-            else:
-                raise ValueError("Incorrect arguments. Usage: blender --python run_command.py -- <in> <out>")
+        cmd = command_data.get("command")
+        seed = command_data.get("seed", 0)
+        
+        if cmd == "create_wall":
+            wall_data = command_data.get("asset", {})
+            name = wall_data.get("name", "GenWall")
+            length = wall_data.get("dimensions", {}).get("width", 4.0)
+            
+            obj, slots = create_engineered_wall(name, length, seed)
+            
+            asset_info = {
+                "name": name,
+                "tags": wall_data.get("tags", ["arch_wall"]),
+                "dimensions": {"width": length, "height": config.STORY_HEIGHT, "depth": config.WALL_THICKNESS_BASE},
+                "slots": slots,
+                "blend_file": os.path.join(config.LIBRARY_DIR, f"{name}.blend"),
+                "seed": seed
+            }
+            InventoryManager.register_asset(asset_info)
+            
+            os.makedirs(config.LIBRARY_DIR, exist_ok=True)
+            lib_path = os.path.join(config.LIBRARY_DIR, f"{name}.blend")
+            bpy.ops.wm.save_as_mainfile(filepath=lib_path)
+            
+            return {"status": "success", "result": {"asset_name": name, "blend_file": lib_path}}
+            
+        elif cmd == "generate_building":
+            spec_data = command_data.get("spec", {})
+            roof_str = spec_data.get("roof", "flat").upper()
+            roof_type = getattr(RoofType, roof_str, RoofType.FLAT)
+            
+            spec = BuildingSpec(
+                width=spec_data.get("width", 20.0),
+                depth=spec_data.get("depth", 16.0),
+                floors=spec_data.get("floors", 1),
+                seed=seed,
+                roof_type=roof_type
+            )
+            
+            out_path = Path(spec_data.get("output_dir", "./output"))
+            out_path.mkdir(parents=True, exist_ok=True)
+            
+            gen_out = generate_building(
+                spec,
+                out_path,
+                spec_data.get("formats", ["glb"]),
+                collider=spec_data.get("collider", True),
+                manifest=spec_data.get("manifest", True)
+            )
+            
+            return {
+                "status": "success",
+                "result": {
+                    "glb_path": str(gen_out.glb_path),
+                    "exports": gen_out.exports,
+                    "manifest": gen_out.export_manifest
+                }
+            }
         else:
-            raise ValueError("Missing -- separator")
+            return {"status": "error", "message": f"Unknown command: {cmd}"}
+            
     except Exception as e:
-        print(f"CLI Error: {e}")
-        sys.exit(1)
+        return {"status": "error", "message": str(e), "traceback": traceback.format_exc()}
+
+def run_payload(command_data: Dict) -> Dict:
+    """Run one command as a one-shot process would: empty scene, execute, fold the inventory log."""
+    # Start from an empty scene once per process, not once per asset
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    result = execute(command_data)
+    # One-shot process: fold this run's inventory log into inventory.json
+    InventoryManager.compact()
+    return result
 
-    if not os.path.exists(input_file):
+def main(argv: List[str]) -> int:
+    """Run the command in the JSON file argv[0] and write the result to argv[1].
+
+    Usable in-process (tests, an already running Blender) as well as from
+    ``blender --background --python run_command.py -- <input.json> <output.json>``.
+    Returns the process exit code.
+    """
+    if len(argv) != 2:
+        print(
+            "Usage: blender --background --python run_command.py -- <input.json> <output.json>",
+            file=sys.stderr,
+        )
+        return 1
+    input_file, output_file = argv
+
+    config.configure_logging()
+    try:
+        with open(input_file, "rb") as f:
+            command_data = jsonio.loads(f.read())
+    except FileNotFoundError:
         result = {"status": "error", "message": f"Input file not found: {input_file}"}
+    except ValueError as e:
+        result = {"status": "error", "message": f"Invalid command payload: {e}"}
     else:
-        try:
-            with open(input_file, 'r') as f:
-                command_data = json.load(f)
-            
-            cmd = command_data.get("command")
-            seed = command_data.get("seed", 0)
-            
-            if cmd == "create_wall":
-                wall_data = command_data.get("asset", {})
-                name = wall_data.get("name", "GenWall")
-                length = wall_data.get("dimensions", {}).get("width", 4.0)
-                
-                obj, slots = create_engineered_wall(name, length, seed)
-                
-                asset_info = {
-                    "name": name,
-                    "tags": wall_data.get("tags", ["arch_wall"]),
-                    "dimensions": {"width": length, "height": config.STORY_HEIGHT, "depth": config.WALL_THICKNESS_BASE},
-                    "slots": slots,
-                    "blend_file": os.path.join(config.LIBRARY_DIR, f"{name}.blend"),
-                    "seed": seed
-                }
-                InventoryManager.register_asset(asset_info)
-                
-                os.makedirs(config.LIBRARY_DIR, exist_ok=True)
-                lib_path = os.path.join(config.LIBRARY_DIR, f"{name}.blend")
-                bpy.ops.wm.save_as_mainfile(filepath=lib_path)
-                
-                result = {"status": "success", "result": {"asset_name": name, "blend_file": lib_path}}
-                
-            elif cmd == "generate_building":
-                spec_data = command_data.get("spec", {})
-                roof_str = spec_data.get("roof", "flat").upper()
-                roof_type = getattr(RoofType, roof_str, RoofType.FLAT)
-                
-                spec = BuildingSpec(
-                    width=spec_data.get("width", 20.0),
-                    depth=spec_data.get("depth", 16.0),
-                    floors=spec_data.get("floors", 1),
-                    seed=seed,
-                    roof_type=roof_type
-                )
-                
-                out_path = Path(spec_data.get("output_dir", "./output"))
-                out_path.mkdir(parents=True, exist_ok=True)
-                
-                gen_out = generate_building(spec, out_path)
-                
-                result = {
-                    "status": "success",
-                    "result": {
-                        "glb_path": str(gen_out.glb_path),
-                        "manifest": gen_out.export_manifest
-                    }
-                }
-            else:
-                result = {"status": "error", "message": f"Unknown command: {cmd}"}
-                
-        except Exception as e:
-            result = {"status": "error", "message": str(e), "traceback": traceback.format_exc()}
+        result = run_payload(command_data)
+
+    with open(output_file, "wb") as f:
+        f.write(jsonio.dumps(result))
+    return 0
+
+def run():
+    """Read the command payload from stdin and print the result line to stdout."""
+    config.configure_logging()
+    try:
+        command_data = jsonio.loads(sys.stdin.buffer.read())
+    except ValueError as e:
+        result = {"status": "error", "message": f"Invalid command payload: {e}"}
+    else:
+        result = run_payload(command_data)
 
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(config.CLI_RESULT_PREFIX + jsonio.dumps(result) + b"\n")
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
+    if "--" in sys.argv:
+        sys.exit(main(sys.argv[sys.argv.index("--") + 1:]))
     run()
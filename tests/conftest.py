@@ -1,6 +1,41 @@
-import sys
-from pathlib import Path
+from itertools import product
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import numpy as np
+import pytest
+
+from blenpc import config
+from blenpc.atoms.door import VALID_MATERIALS, VALID_SWINGS, build_door
+
+
+# Session-wide doors for read-only tests; never mutate these in a test
+@pytest.fixture(scope="session")
+def single_door():
+    return build_door(style="single")
+
+
+@pytest.fixture(scope="session")
+def glass_door():
+    return build_door(style="single", material="glass")
+
+
+@pytest.fixture(scope="session")
+def inward_right_door():
+    return build_door(swing="inward_right")
+
+
+@pytest.fixture(scope="session")
+def door_matrix():
+    """Every style/material/swing door, with per-door columns for bulk checks."""
+    doors = [
+        build_door(style=style, material=material, swing=swing)
+        for style, material, swing in product(config.DOOR_STANDARDS, sorted(VALID_MATERIALS), sorted(VALID_SWINGS))
+    ]
+    return {
+        "doors": doors,
+        "styles": np.array([d.style for d in doors]),
+        "swings": np.array([d.swing for d in doors]),
+        "widths": np.array([d.meta["width_m"] for d in doors]),
+        "heights": np.array([d.meta["height_m"] for d in doors]),
+        "part_positions": np.stack([d.parts.positions for d in doors]),  # (N, P, 3)
+        "slot_positions": np.stack([d.slots.positions for d in doors]),  # (N, S, 3)
+    }
@@ -1,16 +1,11 @@
 import json
-import sys
 import subprocess
 import os
 import pytest
 
-# Add project root to path for imports
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.append(project_root)
-
 from config import BLENDER_PATH
 
+@pytest.mark.integration
 def test_cli_execution():
     input_data = {
         "command": "create_asset",
@@ -39,3 +34,48 @@ def test_cli_execution():
     # Cleanup
     os.remove("test_input.json")
     os.remove("test_output.json")
+
+
+@pytest.fixture
+def cli_module():
+    pytest.importorskip("click")
+    pytest.importorskip("yaml")
+    from blenpc import cli
+    return cli
+
+
+def _fake_export(tmp_path, failing=()):
+    def run_blender_task(input_data, preview=False, use_daemon=True):
+        (fmt,) = input_data["spec"]["formats"]
+        if fmt in failing:
+            return {"status": "error", "message": f"{fmt} crashed"}
+        path = str(tmp_path / f"Building.{fmt}")
+        return {"status": "success", "result": {"exports": {fmt: path}, "glb_path": path}}
+    return run_blender_task
+
+
+@pytest.mark.parametrize("failing", [("fbx",), ("glb", "fbx")])
+def test_parallel_generate_failure_skips_manifest(cli_module, tmp_path, monkeypatch, failing):
+    from click.testing import CliRunner
+
+    monkeypatch.setattr(cli_module, "run_blender_task", _fake_export(tmp_path, failing))
+    result = CliRunner().invoke(
+        cli_module.cli, ["generate", "-o", str(tmp_path), "--format", "glb", "--format", "fbx", "--jobs", "2"]
+    )
+
+    assert result.exit_code == 1
+    assert "export manifest not written" in result.output
+    assert not (tmp_path / "export_manifest.json").exists()
+
+
+def test_parallel_generate_writes_manifest(cli_module, tmp_path, monkeypatch):
+    from click.testing import CliRunner
+
+    monkeypatch.setattr(cli_module, "run_blender_task", _fake_export(tmp_path))
+    result = CliRunner().invoke(
+        cli_module.cli, ["generate", "-o", str(tmp_path), "--format", "glb", "--format", "fbx", "--jobs", "2"]
+    )
+
+    assert result.exit_code == 0
+    manifest = json.loads((tmp_path / "export_manifest.json").read_text())
+    assert manifest["exports"] == {"glb": "Building.glb", "fbx": "Building.fbx"}
@@ -10,11 +10,6 @@ This test file verifies:
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from blenpc.atoms.wall_modular import build_wall_composed, composed_wall_to_json
 from blenpc import config
@@ -345,7 +340,7 @@ class TestWallOpeningAlignment:
         assert len(door_slots) == 1
         
         # Door should have wall interface slot
-        wall_slots = [s for s in door.slots if s["id"] == "wall_interface"]
+        wall_slots = door.slots_by_id["wall_interface"]
         assert len(wall_slots) == 1
     
     def test_window_slot_alignment(self):
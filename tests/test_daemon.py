@@ -0,0 +1,45 @@
+"""
+Test suite for the daemon client and socket setup.
+
+This test file verifies:
+1. A stalled daemon gives an error result instead of hanging the CLI
+2. The socket directory must be private to the current user
+"""
+
+import os
+import socket
+
+import pytest
+
+from blenpc import daemon
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets only")
+
+
+def test_request_times_out_on_stalled_daemon(tmp_path):
+    path = str(tmp_path / "d.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        # Accepts connections but never replies, like a stuck Blender
+        server.listen()
+        res = daemon.request({"command": "ping"}, path=path, timeout=0.1)
+    assert res["status"] == "error"
+    assert "did not answer" in res["message"]
+
+
+def test_request_without_daemon_returns_none(tmp_path):
+    assert daemon.request({"command": "ping"}, path=str(tmp_path / "missing.sock")) is None
+
+
+def test_socket_dir_created_private(tmp_path):
+    directory = tmp_path / "run"
+    daemon._private_socket_dir(str(directory))
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+
+def test_socket_dir_rejects_shared(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    os.chmod(directory, 0o755)
+    with pytest.raises(PermissionError):
+        daemon._private_socket_dir(str(directory))
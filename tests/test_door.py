@@ -10,23 +10,21 @@ This test file verifies:
 """
 
 import pytest
-import sys
-import os
+import json
+import numpy as np
+from collections import namedtuple
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from blenpc.atoms.door import build_door, door_to_json, DOOR_MATERIALS
+from blenpc.atoms.door import PartArray, build_door, door_from_object, door_to_json, DOOR_MATERIALS, _door_record
 from blenpc.engine.grid_pos import GridPos
-from blenpc import config
+from blenpc.config import DOOR_STANDARDS
 
 
 class TestDoorBasics:
     """Test basic door creation."""
     
-    def test_simple_door_creation(self):
+    def test_simple_door_creation(self, single_door):
         """Test creating a simple single door."""
-        door = build_door(style="single", material="wood")
+        door = single_door
         
         assert door.name == "door"
         assert door.style == "single"
@@ -34,17 +32,17 @@ class TestDoorBasics:
         assert len(door.parts) == 4  # jamb_left, jamb_right, head, leaf
         assert len(door.slots) >= 4  # wall_interface, doorknob, hinge_top, hinge_bot
     
-    def test_door_dimensions(self):
+    def test_door_dimensions(self, single_door):
         """Test door dimensions match standards."""
-        door = build_door(style="single")
+        door = single_door
         
-        dims = config.DOOR_STANDARDS["single"]
+        dims = DOOR_STANDARDS["single"]
         assert door.meta["width_m"] == dims["w"]
         assert door.meta["height_m"] == dims["h"]
     
-    def test_door_tags(self):
+    def test_door_tags(self, single_door):
         """Test automatic tag generation."""
-        door = build_door(style="single", material="wood", swing="inward_left")
+        door = single_door
         
         assert "arch_door" in door.tags
         assert "door_single" in door.tags
@@ -56,27 +54,27 @@ class TestDoorBasics:
 class TestDoorParts:
     """Test door part generation."""
     
-    def test_all_parts_present(self):
+    def test_all_parts_present(self, single_door):
         """Test all 4 required parts are generated."""
-        door = build_door(style="single")
+        door = single_door
         
         assert "frame_jamb_left" in door.parts
         assert "frame_jamb_right" in door.parts
         assert "frame_head" in door.parts
         assert "door_leaf" in door.parts
     
-    def test_part_types(self):
+    def test_part_types(self, single_door):
         """Test part types are correctly assigned."""
-        door = build_door(style="single")
+        door = single_door
         
         assert door.parts["frame_jamb_left"]["type"] == "frame_vertical"
         assert door.parts["frame_jamb_right"]["type"] == "frame_vertical"
         assert door.parts["frame_head"]["type"] == "frame_horizontal"
         assert door.parts["door_leaf"]["type"] == "leaf"
     
-    def test_part_positions(self):
+    def test_part_positions(self, single_door):
         """Test parts are positioned correctly."""
-        door = build_door(style="single")
+        door = single_door
         
         # Left jamb should be at x=0
         assert door.parts["frame_jamb_left"]["position"][0] == 0.0
@@ -84,15 +82,15 @@ class TestDoorParts:
         # Right jamb should be at x=width-thickness
         width = door.meta["width_m"]
         thickness = door.meta["frame_thickness"]
-        assert door.parts["frame_jamb_right"]["position"][0] == pytest.approx(width - thickness)
+        assert door.parts["frame_jamb_right"]["position"][0] == width - thickness
         
         # Head should be at top
         height = door.meta["height_m"]
-        assert door.parts["frame_head"]["position"][2] == pytest.approx(height - thickness)
+        assert door.parts["frame_head"]["position"][2] == height - thickness
     
-    def test_leaf_material(self):
+    def test_leaf_material(self, glass_door):
         """Test leaf material is correctly assigned."""
-        door = build_door(style="single", material="glass")
+        door = glass_door
         
         assert door.parts["door_leaf"]["material"] == "glass"
 
@@ -100,68 +98,29 @@ class TestDoorParts:
 class TestDoorStyles:
     """Test different door styles."""
     
-    def test_single_door(self):
-        """Test single door dimensions."""
-        door = build_door(style="single")
+    @pytest.mark.parametrize("style, dims", DOOR_STANDARDS.items(), ids=list(DOOR_STANDARDS))
+    def test_style_dimensions(self, style, dims):
+        """Test door dimensions match the style's standard."""
+        door = build_door(style=style)
         
-        dims = config.DOOR_STANDARDS["single"]
         assert door.meta["width_m"] == dims["w"]
         assert door.meta["height_m"] == dims["h"]
     
-    def test_double_door(self):
-        """Test double door dimensions."""
+    def test_double_wider_than_single(self):
+        """Test double door is wider than a single door."""
         door = build_door(style="double")
-        
-        dims = config.DOOR_STANDARDS["double"]
-        assert door.meta["width_m"] == dims["w"]
-        assert door.meta["height_m"] == dims["h"]
-        assert door.meta["width_m"] > config.DOOR_STANDARDS["single"]["w"]
-    
-    def test_garage_door(self):
-        """Test garage door dimensions."""
-        door = build_door(style="garage")
-        
-        dims = config.DOOR_STANDARDS["garage"]
-        assert door.meta["width_m"] == dims["w"]
-        assert door.meta["height_m"] == dims["h"]
-    
-    def test_invalid_style(self):
-        """Test invalid style raises error."""
-        with pytest.raises(ValueError):
-            build_door(style="invalid_style")
+        assert door.meta["width_m"] > DOOR_STANDARDS["single"]["w"]
 
 
 class TestDoorMaterials:
     """Test door material system."""
     
-    def test_wood_material(self):
-        """Test wood material door."""
-        door = build_door(material="wood")
-        assert door.material == "wood"
-        assert "mat_wood" in door.tags
-    
-    def test_glass_material(self):
-        """Test glass material door."""
-        door = build_door(material="glass")
-        assert door.material == "glass"
-        assert "mat_glass" in door.tags
-    
-    def test_metal_material(self):
-        """Test metal material door."""
-        door = build_door(material="metal")
-        assert door.material == "metal"
-        assert "mat_metal" in door.tags
-    
-    def test_composite_material(self):
-        """Test composite material door."""
-        door = build_door(material="composite")
-        assert door.material == "composite"
-        assert "mat_composite" in door.tags
-    
-    def test_invalid_material(self):
-        """Test invalid material raises error."""
-        with pytest.raises(ValueError):
-            build_door(material="invalid_material")
+    @pytest.mark.parametrize("material", ["wood", "glass", "metal", "composite"])
+    def test_material(self, material):
+        """Test material is recorded and tagged."""
+        door = build_door(material=material)
+        assert door.material == material
+        assert f"mat_{material}" in door.tags
     
     def test_material_definitions(self):
         """Test material definitions exist."""
@@ -174,112 +133,208 @@ class TestDoorMaterials:
 class TestDoorSwing:
     """Test door swing directions."""
     
-    def test_inward_left(self):
-        """Test inward left swing."""
-        door = build_door(swing="inward_left")
-        assert door.swing == "inward_left"
-        assert door.parts["door_leaf"]["swing"] == "inward_left"
-    
-    def test_inward_right(self):
-        """Test inward right swing."""
-        door = build_door(swing="inward_right")
-        assert door.swing == "inward_right"
-    
-    def test_outward_left(self):
-        """Test outward left swing."""
-        door = build_door(swing="outward_left")
-        assert door.swing == "outward_left"
-    
-    def test_outward_right(self):
-        """Test outward right swing."""
-        door = build_door(swing="outward_right")
-        assert door.swing == "outward_right"
-    
-    def test_sliding(self):
-        """Test sliding door."""
-        door = build_door(swing="sliding")
-        assert door.swing == "sliding"
-    
-    def test_invalid_swing(self):
-        """Test invalid swing raises error."""
+    @pytest.mark.parametrize("swing", ["inward_left", "inward_right", "outward_left", "outward_right", "sliding"])
+    def test_swing(self, swing):
+        """Test swing is recorded on the door and its leaf."""
+        door = build_door(swing=swing)
+        assert door.swing == swing
+        assert door.parts["door_leaf"]["swing"] == swing
+
+
+class TestDoorMatrix:
+    """Bulk checks over every style/material/swing combination."""
+    
+    def test_dimensions_match_standards(self, door_matrix):
+        """Widths and heights follow each door's style standard."""
+        styles = door_matrix["styles"]
+        widths = np.array([DOOR_STANDARDS[s]["w"] for s in styles])
+        heights = np.array([DOOR_STANDARDS[s]["h"] for s in styles])
+        
+        assert (door_matrix["widths"] == widths).all()
+        assert (door_matrix["heights"] == heights).all()
+    
+    def test_parts_inside_door(self, door_matrix):
+        """Every part's minimum corner lies within the door's width and height."""
+        pos = door_matrix["part_positions"]
+        
+        assert (pos >= 0).all()
+        assert (pos[:, :, 0] < door_matrix["widths"][:, None]).all()
+        assert (pos[:, :, 2] < door_matrix["heights"][:, None]).all()
+    
+    def test_knob_opposite_hinges(self, door_matrix):
+        """Left-hinged doors put the knob right of centre, all others left of it."""
+        # Slot rows: wall_interface, doorknob, hinge_top, hinge_bot
+        knob_x = door_matrix["slot_positions"][:, 1, 0]
+        hinge_x = door_matrix["slot_positions"][:, 2, 0]
+        left = np.char.find(door_matrix["swings"], "left") >= 0
+        centre = door_matrix["widths"] / 2
+        
+        assert ((knob_x > centre) == left).all()
+        assert ((hinge_x < centre) == left).all()
+
+
+class TestDoorValidation:
+    """Test invalid arguments are rejected."""
+    
+    @pytest.mark.parametrize("kwarg, value", [
+        ("style", "invalid_style"),
+        ("material", "invalid_material"),
+        ("swing", "invalid_swing"),
+    ])
+    def test_invalid_kwargs(self, kwarg, value):
+        """Test invalid style/material/swing raises error."""
         with pytest.raises(ValueError):
-            build_door(swing="invalid_swing")
+            build_door(**{kwarg: value})
 
 
 class TestDoorSlots:
     """Test door slot system."""
     
-    def test_wall_interface_slot(self):
+    def test_wall_interface_slot(self, single_door):
         """Test wall interface slot exists."""
-        door = build_door(style="single")
+        door = single_door
         
-        wall_slots = [s for s in door.slots if s["id"] == "wall_interface"]
+        wall_slots = door.slots_by_id["wall_interface"]
         assert len(wall_slots) == 1
         
         slot = wall_slots[0]
         assert slot["type"] == "door_opening"
         assert slot["required"] is True
     
-    def test_doorknob_slot(self):
+    def test_doorknob_slot(self, single_door):
         """Test doorknob slot exists."""
-        door = build_door(style="single")
+        door = single_door
         
-        knob_slots = [s for s in door.slots if s["id"] == "doorknob"]
+        knob_slots = door.slots_by_id["doorknob"]
         assert len(knob_slots) == 1
         
         slot = knob_slots[0]
         assert slot["type"] == "door_hardware"
         assert slot["required"] is False
     
-    def test_hinge_slots(self):
+    def test_hinge_slots(self, single_door):
         """Test hinge slots exist."""
-        door = build_door(style="single")
+        door = single_door
         
-        hinge_slots = [s for s in door.slots if "hinge" in s["id"]]
+        slots_by_id = door.slots_by_id
+        hinge_slots = slots_by_id.get("hinge_top", ()) + slots_by_id.get("hinge_bot", ())
         assert len(hinge_slots) == 2  # top and bottom
         
         for slot in hinge_slots:
             assert slot["type"] == "door_hinge"
             assert slot["required"] is True
     
-    def test_slot_positions(self):
+    def test_slots_by_id_prebuilt_and_read_only(self):
+        """Doors from one template share a single read-only slot index."""
+        door_a = build_door(name="a")
+        door_b = build_door(name="b")
+        
+        assert door_a.slots_by_id is door_b.slots_by_id
+        with pytest.raises(TypeError):
+            door_a.slots_by_id["doorknob"] = ()
+        with pytest.raises(TypeError):
+            door_a.slots_by_id["doorknob"][0]["occupied"] = True
+    
+    def test_slot_positions(self, single_door):
         """Test slot positions are reasonable."""
-        door = build_door(style="single")
+        door = single_door
+        pos = door.slots.positions
         
-        for slot in door.slots:
-            pos = slot["pos_meters"]
-            
-            # All positions should be within door bounds
-            assert 0 <= pos[0] <= door.meta["width_m"]
-            assert 0 <= pos[2] <= door.meta["height_m"]
+        # All positions should be within door bounds
+        assert ((pos[:, 0] >= 0) & (pos[:, 0] <= door.meta["width_m"])).all()
+        assert ((pos[:, 2] >= 0) & (pos[:, 2] <= door.meta["height_m"])).all()
     
-    def test_doorknob_position_left(self):
+    def test_doorknob_position_left(self, single_door):
         """Test doorknob position for left swing."""
-        door = build_door(swing="inward_left")
+        door = single_door
         
-        knob_slot = [s for s in door.slots if s["id"] == "doorknob"][0]
+        knob_slot = door.slots_by_id["doorknob"][0]
         pos = knob_slot["pos_meters"]
         
         # Knob should be on right side for left swing
         assert pos[0] > door.meta["width_m"] / 2
     
-    def test_doorknob_position_right(self):
+    def test_doorknob_position_right(self, inward_right_door):
         """Test doorknob position for right swing."""
-        door = build_door(swing="inward_right")
+        door = inward_right_door
         
-        knob_slot = [s for s in door.slots if s["id"] == "doorknob"][0]
+        knob_slot = door.slots_by_id["doorknob"][0]
         pos = knob_slot["pos_meters"]
         
         # Knob should be on left side for right swing
         assert pos[0] < door.meta["width_m"] / 2
 
 
+class TestSharedTemplates:
+    """Doors built from one template must not leak edits into each other."""
+    
+    def test_in_place_edits_fail_loudly(self):
+        """Rows and shared columns reject in-place writes."""
+        door = build_door()
+        
+        with pytest.raises(TypeError):
+            door.parts["door_leaf"]["material"] = "glass"
+        with pytest.raises(TypeError):
+            next(iter(door.slots))["occupied"] = True
+        with pytest.raises(TypeError):
+            door.parts.materials[3] = "glass"
+        with pytest.raises(ValueError):
+            door.parts.positions[0, 0] = 1.0
+    
+    def test_edited_door_does_not_affect_next_door(self):
+        """Editing copies of one door's data leaves the template intact."""
+        door = build_door()
+        door.parts = door.parts.copy()
+        door.parts.materials[3] = "glass"
+        door.parts.positions[3, 0] += 0.5
+        door.slots = door.slots.copy()
+        door.slots.occupied[:] = True
+        door.meta["width_m"] = 5.0
+        
+        fresh = build_door()
+        
+        assert door.parts["door_leaf"]["material"] == "glass"
+        assert fresh.parts["door_leaf"]["material"] == "wood"
+        assert fresh.parts["door_leaf"]["position"][0] == fresh.meta["frame_thickness"]
+        assert not fresh.slots.occupied.any()
+        assert fresh.meta["width_m"] == DOOR_STANDARDS["single"]["w"]
+
+
+class TestDoorObjectRecord:
+    """Test the record stored on a door's parent object."""
+    
+    def test_same_name_doors_stay_distinct(self):
+        """Doors sharing a name resolve to their own data, live and rebuilt."""
+        single = build_door(style="single", name="door", position=(1.0, 0.0, 0.0))
+        garage = build_door(style="garage", name="door", position=(4.0, 0.0, 0.0))
+        
+        # Parent objects expose their custom properties like a dict
+        single_obj = _door_record(single)
+        garage_obj = _door_record(garage)
+        
+        assert single_obj["door_id"] != garage_obj["door_id"]
+        assert door_from_object(single_obj) is single
+        assert door_from_object(garage_obj) is garage
+        
+        # Once the live doors are gone, rebuild from the record alone
+        single_pos, garage_pos = single.grid_pos, garage.grid_pos
+        del single, garage
+        
+        rebuilt_single = door_from_object(single_obj)
+        rebuilt_garage = door_from_object(garage_obj)
+        
+        assert (rebuilt_single.name, rebuilt_single.style) == ("door", "single")
+        assert (rebuilt_garage.name, rebuilt_garage.style) == ("door", "garage")
+        assert rebuilt_single.grid_pos == single_pos
+        assert rebuilt_garage.grid_pos == garage_pos
+
+
 class TestGridIntegration:
     """Test integration with grid system."""
     
-    def test_door_implements_igridobject(self):
+    def test_door_implements_igridobject(self, single_door):
         """Test that DoorData implements IGridObject interface."""
-        door = build_door(style="single")
+        door = single_door
         
         # Check required attributes
         assert hasattr(door, 'name')
@@ -292,29 +347,57 @@ class TestGridIntegration:
         # Check grid_pos is GridPos
         assert isinstance(door.grid_pos, GridPos)
     
-    def test_door_footprint(self):
+    def test_door_footprint(self, single_door):
         """Test door footprint calculation."""
-        door = build_door(style="single")
+        door = single_door
         
         footprint = door.get_footprint()
         
         # Should have cells
         assert len(footprint) > 0
     
-    def test_door_aabb(self):
+    def test_door_aabb(self, single_door):
         """Test door AABB calculation."""
-        door = build_door(style="single")
+        door = single_door
         
         aabb = door.get_aabb()
         
         assert "min" in aabb
         assert "max" in aabb
-        assert aabb["min"][0] == pytest.approx(0.0)
-        assert aabb["max"][0] == pytest.approx(door.meta["width_m"])
+        assert aabb["min"][0] == 0.0
+        assert aabb["max"][0] == door.meta["width_m"]
+        assert aabb["max"][2] == door.meta["height_m"]
+    
+    def test_door_aabb_follows_position(self):
+        """AABB is offset by the door's snapped grid position."""
+        door = build_door(position=(1.0, 0.0, 0.0))
+        
+        aabb = door.get_aabb()
+        
+        assert aabb["min"] == pytest.approx(list(door.grid_pos.to_meters()))
+        assert aabb["max"][0] == pytest.approx(1.0 + door.meta["width_m"])
+    
+    def test_door_aabb_after_part_edit(self):
+        """Editing a copy of the parts moves the AABB off the cached bounds."""
+        door = build_door()
+        
+        door.parts = door.parts.copy()
+        door.parts.sizes[door.parts.names.index("frame_head"), 2] += 0.5
+        
+        assert door.get_aabb()["max"][2] == pytest.approx(door.meta["height_m"] + 0.5)
+    
+    def test_door_aabb_without_parts(self):
+        """A door with no parts has a zero-size AABB at its grid position."""
+        door = build_door(position=(1.0, 0.0, 0.0))
+        
+        door.parts = PartArray()
+        
+        origin = list(door.grid_pos.to_meters())
+        assert door.get_aabb() == {"min": origin, "max": origin}
     
-    def test_door_center(self):
+    def test_door_center(self, single_door):
         """Test door center calculation."""
-        door = build_door(style="single")
+        door = single_door
         
         center = door.get_center()
         cx, cy, cz = center.to_meters()
@@ -324,34 +407,58 @@ class TestGridIntegration:
         assert cz == pytest.approx(door.meta["height_m"] / 2, abs=0.1)
 
 
+SerializedDoor = namedtuple("SerializedDoor", ["door", "json_str", "data"])
+
+
+@pytest.fixture(scope="class")
+def serialized_door():
+    """A named wood door, its JSON string and the parsed dict, built once per class."""
+    door = build_door(style="single", material="wood", name="test_door")
+    json_str = door_to_json(door)
+    return SerializedDoor(door, json_str, json.loads(json_str))
+
+
 class TestSerialization:
     """Test JSON serialization."""
     
-    def test_door_to_json(self):
+    def test_door_to_json(self, serialized_door):
         """Test door serialization to JSON."""
-        door = build_door(style="single", material="wood", name="test_door")
-        
-        json_str = door_to_json(door)
+        data = serialized_door.data
         
-        assert "test_door" in json_str
-        assert "single" in json_str
-        assert "wood" in json_str
-        assert "parts" in json_str
-        assert "slots" in json_str
+        assert data["name"] == "test_door"
+        assert data["style"] == "single"
+        assert data["meta"]["material"] == "wood"
+        assert "parts" in data
+        assert "slots" in data
     
-    def test_json_contains_metadata(self):
+    def test_json_contains_metadata(self, serialized_door):
         """Test JSON contains all necessary metadata."""
-        door = build_door(style="single")
-        json_str = door_to_json(door)
-        
-        import json
-        data = json.loads(json_str)
+        data = serialized_door.data
         
         assert "meta" in data
         assert "style" in data
         assert "material" in data
         assert "swing" in data
         assert data["style"] == "single"
+    
+    def test_json_tags_sorted(self, serialized_door):
+        """Tag set serializes as a sorted list."""
+        data = serialized_door.data
+        
+        assert data["tags"] == sorted(serialized_door.door.tags)
+    
+    def test_json_reflects_edited_slots(self):
+        """Shared slots are read-only; an edited copy shows up in the JSON."""
+        door = build_door()
+        
+        with pytest.raises(ValueError):
+            door.slots.occupied[0] = True
+        
+        door.slots = door.slots.copy()
+        door.slots.occupied[0] = True
+        
+        assert json.loads(door_to_json(door))["slots"][0]["occupied"] is True
+        assert json.loads(door_to_json(build_door()))["slots"][0]["occupied"] is False
 
 
 class TestEdgeCases:
@@ -370,9 +477,9 @@ class TestEdgeCases:
         pos_meters = door.grid_pos.to_meters()
         assert pos_meters[0] == pytest.approx(1.0, abs=0.25)
     
-    def test_metadata_completeness(self):
+    def test_metadata_completeness(self, single_door):
         """Test all metadata fields are present."""
-        door = build_door(style="single", material="wood", swing="inward_left")
+        door = single_door
         
         required_meta = ["width_m", "height_m", "style", "material", "swing", 
                         "frame_thickness", "leaf_thickness", "part_count", "slot_count"]
@@ -1,6 +1,8 @@
+import json
 from pathlib import Path
 
 from mf_v5 import BuildingSpec, RoofType, generate
+from mf_v5.export import ExportSettings, export_manifest
 from mf_v5.floorplan import generate_floorplan
 
 
@@ -16,3 +18,25 @@ def test_engine_generates_manifest(tmp_path: Path):
     out = generate(spec, tmp_path)
     assert len(out.floors) == 2
     assert Path(out.export_manifest).exists()
+
+
+def test_parallel_workers_leave_manifest_to_caller(tmp_path: Path):
+    spec = BuildingSpec(width=20, depth=16, floors=1, seed=42, roof_type=RoofType.FLAT)
+    out = generate(spec, tmp_path, ["fbx"], collider=False, manifest=False)
+    assert out.export_manifest is None
+    assert not (tmp_path / "export_manifest.json").exists()
+
+
+def test_merged_manifest_lists_every_format(tmp_path: Path):
+    # What `blenpc generate --jobs` collects from its per-format workers
+    worker_exports = [
+        {"glb": str(tmp_path / "Building.glb")},
+        {"fbx": str(tmp_path / "Building.fbx")},
+        {"obj": str(tmp_path / "Building.obj")},
+    ]
+    merged = {}
+    for exports in worker_exports:
+        merged.update(exports)
+    path = export_manifest(tmp_path / "export_manifest.json", "Building", ExportSettings(), merged)
+    manifest = json.loads(path.read_text())
+    assert manifest["exports"] == {"glb": "Building.glb", "fbx": "Building.fbx", "obj": "Building.obj"}
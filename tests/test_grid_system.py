@@ -8,14 +8,11 @@ This test file verifies:
 4. Backward compatibility with legacy snap() function
 """
 
-import pytest
-import sys
-import os
+import json
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
-from blenpc.engine.grid_pos import GridPos, snap, meters_to_units, units_to_meters
+from blenpc.engine.grid_pos import GridPos, snap, meters_to_grid, meters_to_units, units_to_meters
 from blenpc.engine.grid_manager import SceneGrid
 from blenpc.engine.grid_object import GridObjectMixin, create_grid_object
 from blenpc import config
@@ -282,6 +279,29 @@ class TestSceneGrid:
         assert stats["object_count"] == 1
         assert stats["occupied_cells"] == 1000  # 10x10x10
 
+    def test_to_json_tags(self):
+        """Tag sets serialize sorted; other unserializable fields still raise."""
+        scene = SceneGrid()
+
+        class SimpleObject(GridObjectMixin):
+            def __init__(self, name, pos, tags, snap_mode="meso"):
+                self.name = name
+                self.grid_pos = pos
+                self.grid_size = (1, 1, 1)
+                self.snap_mode = snap_mode
+                self.slots = []
+                self.tags = tags
+
+        scene.place(SimpleObject("door", GridPos(0, 0, 0), frozenset({"mat_wood", "arch_door"})))
+        scene.place(SimpleObject("wall", GridPos(5, 0, 0), ["mat_brick", "arch_wall"]))
+        objects = json.loads(scene.to_json())["objects"]
+        assert objects["door"]["tags"] == ["arch_door", "mat_wood"]
+        assert objects["wall"]["tags"] == ["mat_brick", "arch_wall"]
+
+        scene.place(SimpleObject("odd", GridPos(10, 0, 0), [], snap_mode={"meso"}))
+        with pytest.raises(TypeError):
+            scene.to_json()
+
 
 class TestGridObjectMixin:
     """Test GridObjectMixin default implementations."""
@@ -303,6 +323,17 @@ class TestGridObjectMixin:
         assert (0, 0, 0) in footprint
         assert (1, 1, 1) in footprint
     
+    def test_get_footprint_offset(self):
+        """Footprint of an offset, non-cubic box matches the enumerated cells."""
+        class SimpleObject(GridObjectMixin):
+            def __init__(self):
+                self.grid_pos = GridPos(3, -2, 5)
+                self.grid_size = (4, 1, 3)
+        
+        footprint = SimpleObject().get_footprint()
+        expected = {(3 + x, -2 + y, 5 + z) for x in range(4) for y in range(1) for z in range(3)}
+        assert footprint == expected
+    
     def test_get_aabb(self):
         """Test AABB calculation."""
         class SimpleObject(GridObjectMixin):
@@ -349,6 +380,13 @@ class TestHelperFunctions:
         assert meters_to_units(0.25) == 10
         assert meters_to_units(0.025) == 1
     
+    def test_meters_to_grid_matches_from_meters(self):
+        """Test vectorized snapping agrees with GridPos.from_meters."""
+        coords = [(1.23, 0.0, 2.87), (0.123, 0.075, 0.95), (-0.4, 1.1, 0.3)]
+        for mode in config.SNAP_MODES:
+            expected = [GridPos.from_meters(*c, snap=mode).to_tuple() for c in coords]
+            assert [tuple(row) for row in meters_to_grid(coords, snap=mode).tolist()] == expected
+    
     def test_units_to_meters(self):
         """Test units to meters conversion."""
         assert units_to_meters(40) == pytest.approx(1.0)
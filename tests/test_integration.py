@@ -1,57 +1,54 @@
 import json
-import subprocess
 import os
 import pytest
-import sys
 
-# Add project root to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.append(project_root)
-
-from config import BLENDER_PATH, LIBRARY_DIR, REGISTRY_DIR
-
-def test_full_pipeline_integration():
-    fixture_path = os.path.join(project_root, "tests/fixtures/standard_wall.json")
-    output_path = os.path.join(project_root, "tests/fixtures/standard_wall_output.json")
-    
-    # Ensure fixture exists
-    assert os.path.exists(fixture_path)
-    
-    # Run production command
-    cmd = [
-        BLENDER_PATH,
-        "--background", "--python", os.path.join(project_root, "run_command.py"),
-        "--", fixture_path, output_path
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    assert result.returncode == 0
-    
-    # Validate output report
-    assert os.path.exists(output_path)
-    with open(output_path, "r") as f:
-        data = json.load(f)
-        assert data["status"] == "success"
-        assert "asset_name" in data["result"]
-        
+
+# run_command drives bpy directly; run this inside Blender's Python, e.g.
+# blender --background --python-expr "import pytest; pytest.main(['tests/test_integration.py'])"
+pytest.importorskip("bpy")
+
+from blenpc import config
+from blenpc.config import GRID_UNIT
+from blenpc.engine import inventory_manager
+from blenpc.run_command import run_payload
+
+# Parsed once at import; run_payload does not modify the payload
+with open(os.path.join(project_root, "tests/fixtures/standard_wall.json"), "r") as f:
+    STANDARD_WALL = json.load(f)
+
+@pytest.mark.integration
+def test_full_pipeline_integration(tmp_path, monkeypatch):
+    # Save the .blend and registry under pytest's tmp_path instead of the
+    # shared library and the developer's registry
+    registry_dir = tmp_path / "registry"
+    registry_dir.mkdir()
+    monkeypatch.setattr(config, "LIBRARY_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "REGISTRY_DIR", str(registry_dir))
+    monkeypatch.setattr(config, "INVENTORY_FILE", str(registry_dir / "inventory.json"))
+    monkeypatch.setattr(config, "INVENTORY_LOG_FILE", str(registry_dir / "inventory.log"))
+    monkeypatch.setattr(inventory_manager, "LOCK_FILE", str(registry_dir / ".inventory.lock"))
+
+    # Run production command in this interpreter, no Blender spawn
+    data = run_payload(STANDARD_WALL)
+
+    # Validate result report
+    assert data["status"] == "success"
+    assert "asset_name" in data["result"]
+
     # Validate registry persistence
-    inventory_path = os.path.join(REGISTRY_DIR, "inventory.json")
+    inventory_path = registry_dir / "inventory.json"
     with open(inventory_path, "r") as f:
         inventory = json.load(f)
         asset_name = data["result"]["asset_name"]
         assert asset_name in inventory["assets"]
-        
+
         asset = inventory["assets"][asset_name]
         assert len(asset["slots"]) > 0
-        # Check modularity (GRID_UNIT = 0.25)
+        # Check modularity: x lies on a whole number of grid units
         for slot in asset["slots"]:
-            assert slot["pos"][0] % 0.25 == 0
+            units = slot["pos"][0] / GRID_UNIT
+            assert abs(units - round(units)) < 1e-9
 
     # Validate file existence
-    assert os.path.exists(os.path.join(LIBRARY_DIR, f"{asset_name}.blend"))
-
-    # Cleanup output only, keep fixture
-    if os.path.exists(output_path): os.remove(output_path)
-    if os.path.exists(os.path.join(LIBRARY_DIR, f"{asset_name}.blend")): os.remove(os.path.join(LIBRARY_DIR, f"{asset_name}.blend"))
-    if os.path.exists(os.path.join(REGISTRY_DIR, ".inventory.lock")): os.remove(os.path.join(REGISTRY_DIR, ".inventory.lock"))
+    assert (tmp_path / f"{asset_name}.blend").exists()
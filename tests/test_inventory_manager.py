@@ -0,0 +1,70 @@
+"""
+Test suite for the inventory registry.
+
+This test file verifies:
+1. Returned inventories and assets are private copies of the parse cache
+2. A torn log tail does not swallow later registrations
+"""
+
+import pytest
+
+from blenpc import config, jsonio
+from blenpc.engine import inventory_manager
+from blenpc.engine.inventory_manager import InventoryManager
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "REGISTRY_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "INVENTORY_FILE", str(tmp_path / "inventory.json"))
+    monkeypatch.setattr(config, "INVENTORY_LOG_FILE", str(tmp_path / "inventory.log"))
+    monkeypatch.setattr(inventory_manager, "LOCK_FILE", str(tmp_path / ".inventory.lock"))
+    (tmp_path / "inventory.json").write_bytes(jsonio.dumps({
+        "version": "1.1",
+        "assets": {
+            "wall_a": {"name": "wall_a", "tags": ["wall"], "slots": [{"id": "s0"}]},
+        },
+    }))
+    return tmp_path
+
+
+class TestInventoryCopies:
+    """Test that callers cannot edit the cached inventory."""
+
+    def test_mutated_asset_does_not_reach_cache(self, registry):
+        asset = InventoryManager.find_asset(["wall"])
+        asset["tags"].append("door")
+        asset["slots"][0]["id"] = "edited"
+
+        assert InventoryManager.find_asset(["door"]) is None
+        reloaded = InventoryManager.find_asset(["wall"])
+        assert reloaded["tags"] == ["wall"]
+        assert reloaded["slots"][0]["id"] == "s0"
+
+    def test_mutated_inventory_does_not_reach_cache(self, registry):
+        InventoryManager.register_asset({"name": "wall_b", "tags": ["wall"]})
+        inventory = InventoryManager.load_inventory()
+        inventory["assets"]["wall_a"]["tags"].clear()
+        del inventory["assets"]["wall_b"]
+
+        reloaded = InventoryManager.load_inventory()
+        assert reloaded["assets"]["wall_a"]["tags"] == ["wall"]
+        assert "wall_b" in reloaded["assets"]
+
+
+class TestTornLog:
+    """Test recovery from a write cut short by a crash."""
+
+    def test_register_after_torn_tail_survives_compact(self, registry):
+        InventoryManager.register_asset({"name": "wall_b", "tags": ["wall"]})
+        with open(config.INVENTORY_LOG_FILE, "ab") as f:
+            f.write(b'{"op":"put","name":"wall_c","da')
+        InventoryManager.register_asset({"name": "wall_d", "tags": ["wall"]})
+        InventoryManager.compact()
+
+        inventory = jsonio.loads((registry / "inventory.json").read_bytes())
+        assert sorted(inventory["assets"]) == ["wall_a", "wall_b", "wall_d"]
+        # The unreadable line is kept aside, not deleted
+        assert not (registry / "inventory.log").exists()
+        (torn_file,) = registry.glob("inventory.log.*.torn")
+        assert b'"name":"wall_c","da\n' in torn_file.read_bytes()
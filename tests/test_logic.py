@@ -1,7 +1,8 @@
 import pytest
 from mf_v5.floorplan import generate_floorplan
 from mf_v5.doors import carve_doors, DoorOpening
-from mf_v5.datamodel import WallSegment, Rect
+from mf_v5.datamodel import WallSegment, WallSegmentArray, Rect
+from mf_v5.windows import WindowOpening
 from mf_v5.config import MIN_ROOM_SIZE, EPSILON
 
 def test_floorplan_minimum_room_size():
@@ -41,6 +42,48 @@ def test_door_carving_split_logic():
     total_length = sum(abs(s.x2 - s.x1) for s in carved_segments)
     assert abs(total_length - 4.0) < EPSILON
 
+def test_door_carving_overlapping_doors():
+    """Openings apply in order; one centred in an earlier door's gap is skipped."""
+    wall = WallSegment(room_id=1, side="north", x1=0, y1=0, x2=10, y2=0, height=3.0, thickness=0.2)
+    first = DoorOpening(room_id=1, side="north", center=(3.0, 0), width=2.0, height=2.0)
+    # Centre 3.8 lies in the first door's gap, so its reach to 5.3 is ignored
+    inside_gap = DoorOpening(room_id=1, side="north", center=(3.8, 0), width=3.0, height=2.0)
+    # Centre 7.0 lies in the right piece, which it trims from the left
+    overlapping = DoorOpening(room_id=1, side="north", center=(7.0, 0), width=2.0, height=2.0)
+
+    carved = carve_doors({1: [wall]}, [first, inside_gap, overlapping])[1]
+    assert [(s.x1, s.x2) for s in carved] == [(0, 2.0), (4.0, 6.0), (8.0, 10)]
+
+    # Reversed order: the wide door cuts first and the narrow one is skipped
+    carved = carve_doors({1: [wall]}, [inside_gap, first])[1]
+    assert [(s.x1, s.x2) for s in carved] == [(0, 2.3), (5.3, 10)]
+
+def test_wall_segment_endpoints_are_normalized():
+    """Segments given right-to-left or top-to-bottom are stored min to max."""
+    seg = WallSegment(1, "east", 5, 8, 5, 0, 3.0, 0.2)
+    assert (seg.x1, seg.y1, seg.x2, seg.y2) == (5, 0, 5, 8)
+    assert seg == WallSegment(1, "east", 5, 0, 5, 8, 3.0, 0.2)
+
+def test_rect_bounds_built_once():
+    """Rect.bounds is one read-only array per Rect, outside equality and hashing."""
+    rect = Rect(0.0, 1.0, 4.0, 5.0)
+    assert rect.bounds is rect.bounds
+    assert rect.bounds.tolist() == [0.0, 1.0, 4.0, 5.0]
+    assert not rect.bounds.flags.writeable
+    assert rect == Rect(0.0, 1.0, 4.0, 5.0)
+    assert hash(rect) == hash(Rect(0.0, 1.0, 4.0, 5.0))
+
+def test_wall_segment_array_round_trip():
+    """Segments survive packing into the SoA batch, including window tags."""
+    window = WindowOpening(room_id=1, side="east", center=(5, 2))
+    segments = [
+        WallSegment(1, "north", 0, 0, 5, 0, 3.0, 0.2),
+        WallSegment(1, "east", 5, 1.5, 5, 2.5, 3.0, 0.2, window),
+    ]
+    batch = WallSegmentArray.from_segments(segments)
+    assert len(batch) == 2
+    assert batch.to_segments() == segments
+
 def test_no_overlapping_rooms():
     """Ensure no two rooms overlap in the generated floorplan."""
     rooms, corridor = generate_floorplan(30, 30, 123, 0)
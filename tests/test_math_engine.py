@@ -2,15 +2,12 @@ import json
 import subprocess
 import os
 import pytest
-import sys
 
-# Add project root to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.append(project_root)
 
-from config import BLENDER_PATH, LIBRARY_DIR, REGISTRY_DIR
+from config import BLENDER_PATH, GRID_UNIT, LIBRARY_DIR, REGISTRY_DIR
 
+@pytest.mark.integration
 def test_golden_ratio_wall_production():
     # Test two walls with different seeds to ensure deterministic but different slot placement
     for seed in [123, 456]:
@@ -53,8 +50,8 @@ def test_golden_ratio_wall_production():
             assert "slots" in asset
             assert len(asset["slots"]) > 0
             # Check if position is snapped to GRID_UNIT (0.25)
-            pos_x = asset["slots"][0]["pos"][0]
-            assert pos_x % 0.25 == 0
+            units = asset["slots"][0]["pos"][0] / GRID_UNIT
+            assert abs(units - round(units)) < 1e-9
             
         # Cleanup
         if os.path.exists(input_file): os.remove(input_file)
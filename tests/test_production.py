@@ -2,15 +2,12 @@ import json
 import subprocess
 import os
 import pytest
-import sys
 
-# Add project root to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.append(project_root)
 
 from config import BLENDER_PATH, LIBRARY_DIR, REGISTRY_DIR
 
+@pytest.mark.integration
 def test_wall_production():
     input_data = {
         "command": "create_wall",
@@ -11,10 +11,6 @@ This suite runs all tests and verifies:
 
 import pytest
 import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 def run_all_tests():
     """Run all tests in the repository."""
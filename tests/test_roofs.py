@@ -1,26 +1,31 @@
+import numpy as np
+import pytest
+
 from mf_v5.datamodel import Rect, RoofType
 from mf_v5.roof import build_roof
 
-def test_hip_roof_geometry():
-    rect = Rect(0, 0, 10, 10)
-    roof = build_roof(rect, 0, RoofType.HIP)
-    assert len(roof.faces) == 5 # 4 slopes + 1 bottom
-    assert roof.roof_type == RoofType.HIP
-
-def test_flat_roof_geometry():
-    rect = Rect(0, 0, 10, 10)
-    roof = build_roof(rect, 0, RoofType.FLAT)
-    assert len(roof.faces) == 2 # Top + Bottom
-    assert roof.roof_type == RoofType.FLAT
+RECT = Rect(0, 0, 10, 10)
 
-def test_gabled_roof_geometry():
-    rect = Rect(0, 0, 10, 10)
-    roof = build_roof(rect, 0, RoofType.GABLED)
-    assert len(roof.faces) == 5 # 2 slopes + 2 gable ends + 1 bottom
-    assert roof.roof_type == RoofType.GABLED
+@pytest.mark.parametrize("roof_type,n_faces", [
+    (RoofType.HIP, 5),     # 4 slopes + 1 bottom
+    (RoofType.FLAT, 2),    # Top + Bottom
+    (RoofType.GABLED, 5),  # 2 slopes + 2 gable ends + 1 bottom
+    (RoofType.SHED, 6),    # 1 slope + 4 sides + 1 bottom
+])
+def test_roof_geometry(roof_type, n_faces):
+    roof = build_roof(RECT, 0, roof_type)
+    assert len(roof.faces) == n_faces
+    assert roof.roof_type == roof_type
 
-def test_shed_roof_geometry():
-    rect = Rect(0, 0, 10, 10)
-    roof = build_roof(rect, 0, RoofType.SHED)
-    assert len(roof.faces) == 6 # 1 slope + 4 sides + 1 bottom
-    assert roof.roof_type == RoofType.SHED
+@pytest.mark.parametrize("roof_type", [RoofType.HIP, RoofType.GABLED, RoofType.SHED])
+def test_roof_faces_wind_outward(roof_type):
+    """Every non-degenerate face normal points away from the roof centroid."""
+    roof = build_roof(Rect(0, 0, 10, 8), 3.0, roof_type)
+    centroid = np.unique(roof.vertex_buffer, axis=0).mean(axis=0)
+    for face in roof.faces:
+        co = np.array(face.vertices, dtype=np.float64)
+        # Newell normal, robust for quads and triangles alike
+        normal = np.cross(co, np.roll(co, -1, axis=0)).sum(axis=0)
+        if np.linalg.norm(normal) < 1e-9:
+            continue
+        assert normal.dot(co.mean(axis=0) - centroid) > 0
@@ -3,11 +3,6 @@ Test suite for room detection and automation system.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from blenpc.engine.room_detector import auto_complete_room, RoomData
 from blenpc.atoms.wall_modular import build_wall
@@ -0,0 +1,56 @@
+"""
+Test suite for the slot spatial index.
+
+This test file verifies:
+1. AABB overlap and point queries
+2. Nearest-slot lookup
+3. Indexing door slots directly
+"""
+
+import pytest
+
+from blenpc.atoms.door import build_door
+from blenpc.engine.slot_engine import SlotIndex
+
+
+@pytest.fixture
+def index():
+    return SlotIndex(
+        ["a", "b", "c"],
+        [
+            [0.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+            [2.0, 0.0, 0.0, 3.0, 1.0, 1.0],
+            [0.5, 0.5, 0.5, 2.5, 0.6, 0.6],
+        ],
+    )
+
+
+class TestSlotIndex:
+    """Test spatial queries over slot AABBs."""
+    
+    def test_query_aabb(self, index):
+        """Test overlap queries return matching ids in index order."""
+        assert index.query_aabb([0.9, 0.0, 0.0], [2.1, 0.1, 0.1]) == ["a", "b"]
+        assert index.query_aabb([0.9, 0.5, 0.5], [2.1, 0.55, 0.55]) == ["a", "b", "c"]
+        assert index.query_aabb([5.0, 5.0, 5.0], [6.0, 6.0, 6.0]) == []
+    
+    def test_query_point(self, index):
+        """Test point containment queries."""
+        assert index.query_point([2.5, 0.55, 0.55]) == ["b", "c"]
+        assert index.query_point([1.5, 0.0, 0.0]) == []
+    
+    def test_nearest(self, index):
+        """Test nearest slot centre lookup."""
+        slot_id, distance = index.nearest([2.4, 0.5, 0.5])
+        assert slot_id == "b"
+        assert distance == pytest.approx(0.1)
+        assert SlotIndex([], []).nearest([0.0, 0.0, 0.0]) is None
+    
+    def test_from_door_slots(self):
+        """Test indexing door slots by position and size."""
+        door = build_door(style="single", swing="inward_left")
+        index = SlotIndex.from_slots(door.slots)
+        
+        assert len(index) == len(door.slots)
+        knob = door.slots_by_id["doorknob"][0]
+        assert "doorknob" in index.query_point(knob["pos_meters"])
@@ -10,11 +10,6 @@ This test file verifies:
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from blenpc.atoms.wall_modular import (
     build_wall,